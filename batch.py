@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Solve many inputs for the same day across a pool of processes.
+
+Each input is read and parsed once and both parts are solved from it,
+sharing any work that is common to both.
+Results are printed as each input finishes, not in input order.
+
+    ./batch.py 19 inputs/day19/              # every .txt file in a directory
+    ./batch.py 19 'inputs/day19/*.txt'       # or a glob
+    ./batch.py 19 inputs/day19/ --json       # one JSON object per line
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+import glob
+import json
+import os
+import time
+from types import ModuleType
+from typing import Any, Iterable, Iterator, Optional
+
+import cache
+import engines
+from runner import PARTS, load_day
+
+
+@dataclass
+class BatchResult:
+    filename: str
+    answers: Optional[list[Any]] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def expand_inputs(paths: Iterable[str]) -> list[str]:
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            filenames.extend(sorted(glob.glob(os.path.join(path, "*.txt"))))
+        else:
+            filenames.extend(sorted(glob.glob(path)) or [path])
+    return filenames
+
+
+def parse(day: int, input_str: str, module: ModuleType, use_cache: bool) -> Any:
+    if use_cache:
+        return cache.parse_input(day, input_str, module)
+    return engines.select(module, "parse")(input_str)
+
+
+def solve_input(day: int, filename: str, use_cache: bool = True) -> BatchResult:
+    start = time.perf_counter()
+    module = load_day(day)
+    input_str = module.read_input(filename)
+
+    keys = [cache.cache_key(day, part, input_str, module) for part in PARTS]
+    entries = [cache.get(key) for key in keys] if use_cache else [None, None]
+
+    if all(entries):
+        answers = [entry["answer"] for entry in entries]  # type: ignore
+    elif not any(entries):
+        # solve shares any work common to both parts
+        answers = list(module.solve(parse(day, input_str, module, use_cache)))
+        if use_cache:
+            for key, answer in zip(keys, answers):
+                cache.put(key, answer)
+    else:
+        parsed = parse(day, input_str, module, use_cache)
+        answers = []
+        for part, key, entry in zip(PARTS, keys, entries):
+            if entry:
+                answers.append(entry["answer"])
+                continue
+            answer = engines.select(module, f"part_{part}")(parsed)
+            answers.append(answer)
+            if use_cache:
+                cache.put(key, answer)
+
+    return BatchResult(filename, answers, time.perf_counter() - start)
+
+
+def solve_batch(
+    day: int,
+    filenames: Iterable[str],
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> Iterator[BatchResult]:
+    """Yield a result for each input as soon as it has been solved."""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(solve_input, day, filename, use_cache): filename
+            for filename in filenames
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield BatchResult(futures[future], error=f"{type(e).__name__}: {e}")
+
+
+def format_result(result: BatchResult) -> str:
+    if result.error is not None:
+        return f"{result.filename}: {result.error}"
+    answers = " ".join(
+        f"part_{part}={answer}" for part, answer in zip(PARTS, result.answers or [])
+    )
+    return f"{result.filename} ({result.seconds:.3f}s): {answers}"
+
+
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", nargs="+", help="input files, directories or glob patterns"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of cores)",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print results as JSON lines"
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="ignore cached answers and don't store new ones",
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    filenames = expand_inputs(args.inputs)
+
+    for result in solve_batch(args.day, filenames, args.workers, args.use_cache):
+        if args.json:
+            print(json.dumps(asdict(result)), flush=True)
+        else:
+            print(format_result(result), flush=True)
+
+    if args.use_cache:
+        cache.evict()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+"""
+Benchmark the solutions against generated inputs of increasing size.
+
+Inputs come from generators.py, so runs with the same seed are
+comparable. Results are written as JSON so that runs can be diffed.
+
+    ./bench.py                                # every day, default sizes
+    ./bench.py 15 19 --sizes 10 20 40 --repeat 5 --output bench.json
+
+Parsed inputs are cached (see cache.py), so only the first repeat of the
+first run parses the text. Pass --no-cache to parse every time.
+"""
+import argparse
+from dataclasses import asdict, dataclass, field
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Iterable, Optional
+
+import cache
+import engines
+from generators import SIZE_KNOBS, generate
+from runner import NUM_DAYS, PARTS, load_day
+
+DEFAULT_SIZES = {
+    1: [1000, 10000, 100000],
+    2: [1000, 10000, 100000],
+    3: [1000, 10000, 100000],
+    4: [10, 100, 1000],
+    5: [100, 500, 2000],
+    6: [100, 1000, 10000],
+    7: [100, 300, 1000],
+    8: [200, 2000, 20000],
+    9: [20, 40, 60],
+    10: [100, 1000, 10000],
+    11: [10, 20, 40],
+    12: [3, 5, 7],
+    13: [100, 1000, 10000],
+    14: [10, 100, 1000],
+    15: [10, 25, 50],
+    16: [100, 1000, 10000],
+    17: [20, 50, 100],
+    18: [10, 25, 50],
+    19: [3, 4, 6],
+    20: [10, 25, 50],
+    21: [0],
+    22: [20, 100, 200],
+    23: [0],
+    # Day 24 keeps around 10^7 states whatever the program looks like, which
+    # is too slow to run by default. Pass --sizes to include it.
+    24: [],
+    25: [20, 50, 100],
+}
+
+
+@dataclass
+class Benchmark:
+    day: int
+    size: int
+    part: int
+    answer: Any
+    seconds: list[float] = field(default_factory=list)
+
+    @property
+    def best(self) -> float:
+        return min(self.seconds)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.seconds)
+
+
+def bench_day(
+    day: int,
+    sizes: Iterable[int],
+    repeat: int = 3,
+    seed: int = 0,
+    use_cache: bool = True,
+    engine: Optional[str] = None,
+) -> list[Benchmark]:
+    module = load_day(day)
+    parse = engines.select(module, "parse", engine)
+    results = []
+    for size in sizes:
+        input_str = generate(day, size, seed)
+        for part in PARTS:
+            solve = engines.select(module, f"part_{part}", engine)
+            benchmark = Benchmark(day, size, part, None)
+            for _ in range(repeat):
+                # Load a fresh copy every time, as some solutions modify
+                # their input
+                if use_cache:
+                    parsed = cache.parse_input(day, input_str, module, engine)
+                else:
+                    parsed = parse(input_str)
+                start = time.perf_counter()
+                benchmark.answer = solve(parsed)
+                benchmark.seconds.append(time.perf_counter() - start)
+            results.append(benchmark)
+    return results
+
+
+def to_json(benchmarks: list[Benchmark], seed: int, repeat: int) -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": [
+            {
+                **asdict(b),
+                "answer": b.answer if isinstance(b.answer, int) else str(b.answer),
+                "knob": SIZE_KNOBS[b.day],
+                "best": b.best,
+                "median": b.median,
+            }
+            for b in benchmarks
+        ],
+    }
+
+
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        default=list(range(1, NUM_DAYS + 1)),
+        help="days to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="input sizes (default: per day)"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench.json", help="JSON output file")
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="parse the input text every time rather than using cached parses",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=engines.KINDS,
+        default=engines.default_name(),
+        help="benchmark this engine where a day has one rather than the fastest",
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+
+    benchmarks = []
+    for day in args.days:
+        sizes = args.sizes or DEFAULT_SIZES[day]
+        for b in bench_day(
+            day, sizes, args.repeat, args.seed, args.use_cache, args.engine
+        ):
+            print(
+                f"day{b.day:02} part {b.part} size={b.size:<7} "
+                f"best={b.best:.4f}s median={b.median:.4f}s",
+                file=sys.stderr,
+            )
+            benchmarks.append(b)
+
+    with open(args.output, "w") as f:
+        json.dump(to_json(benchmarks, args.seed, args.repeat), f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Persistent on-disk cache of answers.
+
+Answers are keyed on a hash of the input and a version of the solver,
+so a repeated run with the same input returns straight away. The solver
+version is a hash of the day's source code and of any other modules in
+this repository that it uses, so changing a solution invalidates its
+cached answers without having to remember to bump anything.
+
+Parsed inputs are cached in the same way, so that solving an input
+again, e.g. in a benchmark, skips parsing the text. They are keyed on
+the solver version too, as that includes the day's parse_input.
+
+Both are keyed on the engine asked for as well (see engines.py), so
+that e.g. --engine reference doesn't return the fastest engine's
+answers from the cache.
+
+Answers are stored as small JSON files and parsed inputs as pickles, in
+.aoc_cache (or $AOC_CACHE_DIR), and both are evicted by age and by the
+total size of the cache.
+"""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import time
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+import engines
+
+CACHE_DIR_ENV_VAR = "AOC_CACHE_DIR"
+DEFAULT_CACHE_DIR = ".aoc_cache"
+
+MAX_AGE = 30 * 24 * 60 * 60  # seconds
+MAX_SIZE = 100 * 1024 * 1024  # bytes
+
+ANSWER_SUFFIX = ".json"
+PARSED_SUFFIX = ".pickle"
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_solver_versions: dict[str, str] = {}
+
+
+def cache_dir() -> str:
+    return os.environ.get(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR)
+
+
+def input_hash(input_str: str) -> str:
+    return hashlib.sha256(input_str.encode()).hexdigest()
+
+
+def local_dependencies(module: ModuleType) -> set[ModuleType]:
+    """
+    Modules in this repository that module uses, whether it imported the
+    module itself or just names from it.
+    """
+    dependencies = set()
+    for value in vars(module).values():
+        dependency = value if inspect.ismodule(value) else inspect.getmodule(value)
+        filename = getattr(dependency, "__file__", None)
+        if (
+            dependency is not None
+            and dependency is not module
+            and filename
+            and os.path.dirname(os.path.abspath(filename)) == REPO_DIR
+        ):
+            dependencies.add(dependency)
+    return dependencies
+
+
+def solver_version(module: ModuleType) -> str:
+    if module.__name__ not in _solver_versions:
+        sha = hashlib.sha256(inspect.getsource(module).encode())
+        for dependency in sorted(local_dependencies(module), key=lambda m: m.__name__):
+            sha.update(inspect.getsource(dependency).encode())
+        _solver_versions[module.__name__] = sha.hexdigest()
+    return _solver_versions[module.__name__]
+
+
+def _key(
+    prefix: str, input_str: str, module: ModuleType, engine: Optional[str] = None
+) -> str:
+    engine = engine or engines.default_name() or "fastest"
+    sha = hashlib.sha256(
+        f"{input_hash(input_str)}:{solver_version(module)}:{engine}".encode()
+    )
+    return f"{prefix}-{sha.hexdigest()[:32]}"
+
+
+def cache_key(
+    day: int,
+    part: int,
+    input_str: str,
+    module: ModuleType,
+    engine: Optional[str] = None,
+) -> str:
+    return _key(f"day{day:02}-part{part}", input_str, module, engine)
+
+
+def parsed_key(
+    day: int, input_str: str, module: ModuleType, engine: Optional[str] = None
+) -> str:
+    return _key(f"day{day:02}-parsed", input_str, module, engine)
+
+
+def entry_filename(key: str, suffix: str = ANSWER_SUFFIX) -> str:
+    return os.path.join(cache_dir(), f"{key}{suffix}")
+
+
+def _read(key: str, suffix: str, load: Callable[[bytes], Any]) -> Optional[Any]:
+    filename = entry_filename(key, suffix)
+    try:
+        with open(filename, "rb") as f:
+            entry = load(f.read())
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        return None
+    # Touch the entry so that eviction by size removes the least
+    # recently used entries first
+    os.utime(filename)
+    return entry
+
+
+def _write(key: str, suffix: str, data: bytes) -> None:
+    os.makedirs(cache_dir(), exist_ok=True)
+    # Write to a temporary file first, as several workers may be writing
+    # to the cache at the same time
+    fd, temp_filename = tempfile.mkstemp(dir=cache_dir(), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(temp_filename, entry_filename(key, suffix))
+
+
+def get(key: str) -> Optional[dict]:
+    return _read(key, ANSWER_SUFFIX, json.loads)
+
+
+def put(key: str, answer: Any) -> None:
+    entry = {"answer": answer, "created": time.time()}
+    _write(key, ANSWER_SUFFIX, json.dumps(entry).encode())
+
+
+def get_parsed(key: str) -> Optional[Any]:
+    return _read(key, PARSED_SUFFIX, pickle.loads)
+
+
+def put_parsed(key: str, parsed: Any) -> None:
+    try:
+        data = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Not everything can be pickled, and it's only a cache
+        return
+    _write(key, PARSED_SUFFIX, data)
+
+
+def parse_input(
+    day: int, input_str: str, module: ModuleType, engine: Optional[str] = None
+) -> Any:
+    """
+    input_str parsed by module's engine called engine (see engines.select),
+    from the cache if it's been parsed by that engine before.
+    """
+    key = parsed_key(day, input_str, module, engine)
+    parsed = get_parsed(key)
+    if parsed is None:
+        parsed = engines.select(module, "parse", engine)(input_str)
+        put_parsed(key, parsed)
+    return parsed
+
+
+def evict(max_age: float = MAX_AGE, max_size: int = MAX_SIZE) -> int:
+    """
+    Remove entries that haven't been used for max_age seconds, then remove
+    the least recently used entries until the cache is no larger than
+    max_size.
+    Returns the number of entries removed.
+    """
+    try:
+        filenames = [
+            os.path.join(cache_dir(), name)
+            for name in os.listdir(cache_dir())
+            if name.endswith((ANSWER_SUFFIX, PARSED_SUFFIX))
+        ]
+    except FileNotFoundError:
+        return 0
+
+    entries = []
+    for filename in filenames:
+        stat = os.stat(filename)
+        entries.append((stat.st_mtime, stat.st_size, filename))
+    entries.sort(reverse=True)
+
+    now = time.time()
+    total_size = 0
+    removed = 0
+    for mtime, size, filename in entries:
+        if now - mtime > max_age or total_size + size > max_size:
+            os.remove(filename)
+            removed += 1
+        else:
+            total_size += size
+    return removed
@@ -0,0 +1,155 @@
+"""
+Checkpoints for simulations that run step by step.
+
+A Simulation steps a state forward one step at a time. With
+checkpointing turned on it saves the state every so many steps, and
+picks up from the latest saved step rather than from the start, whether
+that's to resume a run that was interrupted or to fast-forward to a
+later horizon:
+
+    simulation = Simulation("day20", day20, (grid, algorithm), (grid, 0), step)
+    part_1 = simulation.advance_to(2)
+    part_2 = simulation.advance_to(50)
+
+Checkpointing is off unless AOC_CHECKPOINT_EVERY is set to the number of
+steps between checkpoints. They are saved as compressed pickles in
+.aoc_checkpoints (or $AOC_CHECKPOINT_DIR), under the simulation's name
+and a hash of whatever identifies its input and of the solver's version
+(see cache.py), so changing a solution doesn't resume from states saved
+by the old one.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from types import ModuleType
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
+import zlib
+
+import cache
+
+S = TypeVar("S")
+
+EVERY_ENV_VAR = "AOC_CHECKPOINT_EVERY"
+DIR_ENV_VAR = "AOC_CHECKPOINT_DIR"
+DEFAULT_DIR = ".aoc_checkpoints"
+
+SUFFIX = ".ckpt"
+
+
+def checkpoint_dir() -> str:
+    return os.environ.get(DIR_ENV_VAR, DEFAULT_DIR)
+
+
+def default_every() -> Optional[int]:
+    value = os.environ.get(EVERY_ENV_VAR)
+    return int(value) or None if value else None
+
+
+def dumps(state: Any) -> bytes:
+    return zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def loads(data: bytes) -> Any:
+    return pickle.loads(zlib.decompress(data))
+
+
+class Checkpoints:
+    """The saved states of one simulation of one input, by step."""
+
+    def __init__(self, name: str, identity: Any, version: str = ""):
+        sha = hashlib.sha256(version.encode())
+        sha.update(pickle.dumps(identity))
+        key = sha.hexdigest()[:16]
+        self.directory = os.path.join(checkpoint_dir(), f"{name}-{key}")
+
+    def steps(self) -> list[int]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(n[: -len(SUFFIX)]) for n in names if n.endswith(SUFFIX))
+
+    def filename(self, step: int) -> str:
+        return os.path.join(self.directory, f"{step:08}{SUFFIX}")
+
+    def latest(self, max_step: Optional[int] = None) -> Optional[Tuple[int, Any]]:
+        """The last saved step and its state, up to max_step if given."""
+        steps = [s for s in self.steps() if max_step is None or s <= max_step]
+        for step in reversed(steps):
+            try:
+                with open(self.filename(step), "rb") as f:
+                    return step, loads(f.read())
+            except (OSError, ValueError, zlib.error, pickle.UnpicklingError):
+                # Skip anything left half-written by a crash
+                continue
+        return None
+
+    def save(self, step: int, state: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_filename = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps(state))
+        os.replace(temp_filename, self.filename(step))
+
+
+class Simulation(Generic[S]):
+    def __init__(
+        self,
+        name: str,
+        module: ModuleType,
+        identity: Any,
+        state: S,
+        step_function: Callable[[S], S],
+        every: Optional[int] = None,
+    ):
+        """
+        module is the solver, whose version is part of the checkpoints'
+        key. identity is anything picklable that determines the whole run,
+        such as the input. It and the states should only be made of
+        builtin types and classes from other modules than the solver,
+        whose own classes pickle differently when it's run as a script.
+        every overrides $AOC_CHECKPOINT_EVERY.
+        """
+        self.step = 0
+        self.state = state
+        self.step_function = step_function
+        self.every = every if every is not None else default_every()
+        self.checkpoints = (
+            Checkpoints(name, identity, cache.solver_version(module))
+            if self.every
+            else None
+        )
+
+    def fast_forward(self, max_step: Optional[int] = None) -> None:
+        if self.checkpoints is None:
+            return
+        saved = self.checkpoints.latest(max_step)
+        if saved is not None and saved[0] > self.step:
+            self.step, self.state = saved
+
+    def advance(self) -> None:
+        self.state = self.step_function(self.state)
+        self.step += 1
+        if self.checkpoints is not None and self.every and self.step % self.every == 0:
+            self.checkpoints.save(self.step, self.state)
+
+    def advance_to(self, step: int) -> S:
+        """The state after step steps."""
+        if step < self.step:
+            raise ValueError(f"Already at step {self.step}, can't go back to {step}")
+        self.fast_forward(step)
+        while self.step < step:
+            self.advance()
+        return self.state
+
+    def advance_until(self, done: Callable[[S], bool]) -> S:
+        """
+        The first state that is done. This resumes from the latest
+        checkpoint, so a simulation that is run until it's done shouldn't
+        share its name with one that is run to a fixed number of steps.
+        """
+        self.fast_forward()
+        while not done(self.state):
+            self.advance()
+        return self.state
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+"""
+Measure how the solutions' running times grow with the size of the input.
+
+Parsing and each part are timed separately on generated inputs of
+geometrically increasing size, and for each of them a straight line is
+fitted to log(time) against log(size). Its slope is the empirical
+exponent: about 1 for a linear solution, 2 for a quadratic one, in terms
+of each day's size knob (see generators.py).
+
+Every run is appended to complexity.jsonl along with the commit it was
+run on, and any exponent that has grown by more than --tolerance since
+the last run on a different commit is flagged as a regression:
+
+    ./complexity.py                          # every day that scales
+    ./complexity.py 7 16 22 --start 100 --factor 2 --steps 6
+    ./complexity.py 16 --engine reference --start 1000   # the bit-string parser
+
+By default each day is measured at the sizes in COMPLEXITY_SIZES. Passing
+--start, --factor or --steps measures geometric sizes instead.
+"""
+import argparse
+from dataclasses import asdict, dataclass
+import json
+import math
+import statistics
+import subprocess
+import sys
+import time
+from typing import Iterable, Optional
+
+from bench import bench_day
+import engines
+from generators import generate
+from runner import PARTS, load_day
+
+DEFAULT_HISTORY = "complexity.jsonl"
+DEFAULT_FACTOR = 2
+DEFAULT_STEPS = 5
+DEFAULT_TOLERANCE = 0.5
+
+# The sizes each day is measured at by default, doubling up to whatever
+# still runs in a few seconds
+COMPLEXITY_SIZES = {
+    1: [1000, 2000, 4000, 8000, 16000],
+    2: [1000, 2000, 4000, 8000, 16000],
+    3: [1000, 2000, 4000, 8000, 16000],
+    4: [10, 20, 40, 80, 160],
+    5: [100, 200, 400, 800, 1600],
+    6: [100, 200, 400, 800, 1600],
+    7: [100, 200, 400, 800, 1600],
+    8: [200, 400, 800, 1600, 3200],
+    9: [10, 20, 40, 80],
+    10: [100, 200, 400, 800, 1600],
+    11: [10, 20, 40, 80, 160],
+    # The number of routes grows exponentially with the number of small
+    # caves, so there's no exponent to fit. Pass --start to include it.
+    12: [],
+    13: [100, 200, 400, 800, 1600],
+    14: [10, 20, 40, 80, 160],
+    15: [10, 20, 40, 80],
+    16: [100, 200, 400, 800, 1600],
+    17: [20, 40, 80, 160],
+    18: [5, 10, 20, 40],
+    # Matching scanners takes minutes from a dozen of them, and isn't
+    # polynomial in their number. Pass --start to include it.
+    19: [],
+    20: [10, 20, 40, 80],
+    # Days 21 and 23 ignore their size, and day 24 is too slow to scale
+    # (see bench.py)
+    21: [],
+    22: [20, 40, 80, 160],
+    23: [],
+    24: [],
+    25: [20, 40, 80, 160],
+}
+
+
+@dataclass
+class Growth:
+    day: int
+    stage: str
+    sizes: list[int]
+    seconds: list[float]
+    exponent: float
+
+
+def geometric_sizes(start: int, factor: float, steps: int) -> list[int]:
+    return [round(start * factor**i) for i in range(steps)]
+
+
+def fit_exponent(sizes: Iterable[int], seconds: Iterable[float]) -> float:
+    """The slope of log(seconds) against log(sizes)."""
+    slope, intercept = statistics.linear_regression(
+        [math.log(size) for size in sizes],
+        # Times that are too short to measure would have an infinite log
+        [math.log(max(s, 1e-9)) for s in seconds],
+    )
+    return slope
+
+
+def time_parse(
+    day: int,
+    sizes: list[int],
+    repeat: int = 3,
+    seed: int = 0,
+    engine: Optional[str] = None,
+) -> list[float]:
+    """The best time to parse the generated input of each size."""
+    parse = engines.select(load_day(day), "parse", engine)
+    best = []
+    for size in sizes:
+        input_str = generate(day, size, seed)
+        seconds = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(input_str)
+            seconds.append(time.perf_counter() - start)
+        best.append(min(seconds))
+    return best
+
+
+def measure_day(
+    day: int, sizes: list[int], repeat: int = 3, engine: Optional[str] = None
+) -> list[Growth]:
+    # Parsing is timed as a stage of its own, as some days do most of
+    # their work there
+    seconds = time_parse(day, sizes, repeat, engine=engine)
+    growths = [Growth(day, "parse", sizes, seconds, fit_exponent(sizes, seconds))]
+    # Cached parses would only be loaded, so parse from scratch
+    benchmarks = bench_day(day, sizes, repeat, use_cache=False, engine=engine)
+    for part in PARTS:
+        seconds = [b.best for b in benchmarks if b.part == part]
+        growths.append(
+            Growth(day, f"part_{part}", sizes, seconds, fit_exponent(sizes, seconds))
+        )
+    return growths
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def read_history(filename: str) -> list[dict]:
+    try:
+        with open(filename) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def append_history(filename: str, record: dict) -> None:
+    with open(filename, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def previous_exponents(
+    history: list[dict], commit: str, engine: Optional[str]
+) -> dict[tuple[int, str], tuple[str, float]]:
+    """
+    The exponent of each stage from the latest run on a commit other than
+    commit, with the same engine, by (day, stage).
+    """
+    previous = {}
+    for record in history:
+        if record["commit"] == commit or record.get("engine") != engine:
+            continue
+        for growth in record["results"]:
+            previous[(growth["day"], growth["stage"])] = (
+                record["commit"],
+                growth["exponent"],
+            )
+    return previous
+
+
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        help="days to measure (default: every day whose input size can vary)",
+    )
+    parser.add_argument(
+        "--start",
+        type=int,
+        help="smallest input size (default: the day's smallest size)",
+    )
+    parser.add_argument(
+        "--factor", type=float, help=f"default with --start: {DEFAULT_FACTOR}"
+    )
+    parser.add_argument(
+        "--steps", type=int, help=f"default with --start: {DEFAULT_STEPS}"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--engine",
+        choices=engines.KINDS,
+        default=engines.default_name(),
+        help="measure this engine where a day has one rather than the fastest",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="how much an exponent can grow before it's flagged "
+        f"(default: {DEFAULT_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--history",
+        default=DEFAULT_HISTORY,
+        help=f"JSON lines file of previous runs (default: {DEFAULT_HISTORY})",
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+
+    days = args.days or [day for day, sizes in COMPLEXITY_SIZES.items() if sizes]
+    geometric = any(arg is not None for arg in (args.start, args.factor, args.steps))
+
+    commit = current_commit()
+    previous = previous_exponents(read_history(args.history), commit, args.engine)
+
+    results = []
+    regressions = 0
+    for day in days:
+        if not (args.start or COMPLEXITY_SIZES[day]):
+            print(f"day{day:02} has no default sizes, pass --start", file=sys.stderr)
+            continue
+        if geometric:
+            sizes = geometric_sizes(
+                args.start or COMPLEXITY_SIZES[day][0],
+                args.factor or DEFAULT_FACTOR,
+                args.steps or DEFAULT_STEPS,
+            )
+        else:
+            sizes = COMPLEXITY_SIZES[day]
+        for growth in measure_day(day, sizes, args.repeat, args.engine):
+            results.append(growth)
+            line = f"day{day:02} {growth.stage} exponent={growth.exponent:.2f}"
+            if (day, growth.stage) in previous:
+                previous_commit, exponent = previous[(day, growth.stage)]
+                line += f" (was {exponent:.2f} at {previous_commit})"
+                if growth.exponent > exponent + args.tolerance:
+                    line += " REGRESSION"
+                    regressions += 1
+            print(line)
+
+    append_history(
+        args.history,
+        {
+            "commit": commit,
+            "time": time.time(),
+            "engine": args.engine,
+            # The sizes of each day are in its results
+            "factor": (args.factor or DEFAULT_FACTOR) if geometric else None,
+            "results": [asdict(growth) for growth in results],
+        },
+    )
+
+    if regressions:
+        print(f"{regressions} regressions", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
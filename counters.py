@@ -0,0 +1,59 @@
+"""
+Counters of the work done by the solvers, such as the number of states
+a search expanded, so that slow runs can be explained.
+
+Counting is off unless something turns it on, e.g. runner.py --counters
+or the AOC_COUNTERS environment variable. Solvers count cheaply in
+their hot loops, in local variables where they can, and hand the totals
+over once they're done:
+
+    pops = 0
+    while todo:
+        pops += 1
+        ...
+    counters.add("queue_pops", pops)
+
+add() does nothing at all while counting is off.
+"""
+from collections import Counter
+from contextlib import contextmanager
+import os
+from typing import Iterator
+
+ENV_VAR = "AOC_COUNTERS"
+
+enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+_counts: Counter[str] = Counter()
+
+
+def add(name: str, n: int = 1) -> None:
+    if enabled:
+        _counts[name] += n
+
+
+def get() -> dict[str, int]:
+    return dict(_counts)
+
+
+def reset() -> None:
+    _counts.clear()
+
+
+@contextmanager
+def counting() -> Iterator[dict[str, int]]:
+    """
+    Count everything in the block, starting from zero. The dict is filled
+    in when the block ends.
+    """
+    global enabled
+    previous = enabled
+    enabled = True
+    reset()
+    counts: dict[str, int] = {}
+    try:
+        yield counts
+    finally:
+        counts.update(_counts)
+        enabled = previous
+        reset()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+"""
+A long-lived solver daemon, listening on a Unix domain socket.
+
+Starting the interpreter and importing a day takes longer than solving
+most of the early days, so the daemon imports every day up front and
+keeps a pool of worker processes running between requests.
+
+    ./daemon.py serve &                    # start the daemon
+    ./daemon.py solve 1 1 day01.txt        # solve part 1 of day 1
+    ./daemon.py solve 6 2 - < day06.txt    # send the input itself
+
+Each request and response is a single line of JSON. A request has a day,
+a part, and either an input_path (read by the worker) or the input
+itself as a string:
+
+    {"day": 1, "part": 1, "input_path": "/path/to/day01.txt"}
+    {"day": 1, "part": 1, "input": "199\\n200\\n..."}
+
+and the response is the runner's Result with the time the daemon spent
+on the whole request, including waiting for a free worker:
+
+    {"day": 1, "part": 1, "answer": 7, "seconds": 0.0012, ...,
+     "request_seconds": 0.0031}
+
+A connection can send any number of requests, one per line, and gets
+the responses back in the same order.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+from typing import Any, Optional
+
+import cache
+from runner import NUM_DAYS, PARTS, Result, load_day, run_part
+
+SOCKET_ENV_VAR = "AOC_DAEMON_SOCKET"
+DEFAULT_SOCKET = ".aoc_daemon.sock"
+
+
+def socket_path(option: Optional[str] = None) -> str:
+    return option or os.environ.get(SOCKET_ENV_VAR) or DEFAULT_SOCKET
+
+
+def import_days() -> None:
+    for day in range(1, NUM_DAYS + 1):
+        load_day(day)
+
+
+def init_worker() -> None:
+    # Ctrl-C goes to the whole process group, but shutting down the pool
+    # is the server's job
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    import_days()
+
+
+def solve_request(
+    executor: ProcessPoolExecutor, request: dict, use_cache: bool = True
+) -> dict:
+    start = time.perf_counter()
+    try:
+        day = int(request["day"])
+        part = int(request["part"])
+        if not 1 <= day <= NUM_DAYS or part not in PARTS:
+            raise ValueError(f"No such puzzle: day {day} part {part}")
+        if "input" in request:
+            future = executor.submit(
+                run_part, day, part, "<request>", False, use_cache, request["input"]
+            )
+        elif "input_path" in request:
+            future = executor.submit(
+                run_part, day, part, request["input_path"], False, use_cache
+            )
+        else:
+            raise ValueError("Request needs either input or input_path")
+        response = asdict(future.result())
+    except Exception as e:
+        response = asdict(
+            Result(
+                request.get("day", 0),
+                request.get("part", 0),
+                error=f"{type(e).__name__}: {e}",
+            )
+        )
+    response["request_seconds"] = time.perf_counter() - start
+    return response
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:
+                response: dict[str, Any] = {"error": f"Invalid request: {e}"}
+            else:
+                response = solve_request(
+                    self.server.executor, request, self.server.use_cache
+                )
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(
+        self, path: str, max_workers: Optional[int] = None, use_cache: bool = True
+    ):
+        # Import every day before starting the workers, so that they start
+        # with everything already imported. init_worker makes sure of it
+        # when workers are spawned rather than forked.
+        import_days()
+        max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=init_worker
+        )
+        # Start all of the workers now rather than on the first request
+        list(self.executor.map(int, range(max_workers)))
+        self.use_cache = use_cache
+        super().__init__(path, Handler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+def serve(path: str, max_workers: Optional[int] = None, use_cache: bool = True):
+    if os.path.exists(path):
+        # Only remove a socket left behind by a daemon that's gone away
+        try:
+            with socket.socket(socket.AF_UNIX) as s:
+                s.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+
+    with Server(path, max_workers, use_cache) as server:
+        print(f"Listening on {path}", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(path)
+            if use_cache:
+                cache.evict()
+
+
+def request(
+    path: str,
+    day: int,
+    part: int,
+    input_path: Optional[str] = None,
+    input_str: Optional[str] = None,
+) -> dict:
+    """Send one request to the daemon and wait for its response."""
+    message: dict[str, Any] = {"day": day, "part": part}
+    if input_str is not None:
+        message["input"] = input_str
+    elif input_path is not None:
+        # The daemon may be running in a different directory
+        message["input_path"] = os.path.abspath(input_path)
+    else:
+        raise ValueError("Need either input_path or input_str")
+
+    with socket.socket(socket.AF_UNIX) as s:
+        s.connect(path)
+        with s.makefile("rwb") as f:
+            f.write(json.dumps(message).encode() + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--socket",
+        help=f"path of the socket (default: ${SOCKET_ENV_VAR} or {DEFAULT_SOCKET})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of cores)",
+    )
+    serve_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="ignore cached answers and don't store new ones",
+    )
+
+    solve_parser = subparsers.add_parser("solve", help="send a request to the daemon")
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("part", type=int, choices=PARTS)
+    solve_parser.add_argument(
+        "input", nargs="?", help="input file, or - to send stdin (default: dayNN.txt)"
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    path = socket_path(args.socket)
+
+    if args.command == "serve":
+        serve(path, args.workers, args.use_cache)
+        return
+
+    if args.input == "-":
+        response = request(path, args.day, args.part, input_str=sys.stdin.read())
+    else:
+        input_path = args.input or f"day{args.day:02}.txt"
+        response = request(path, args.day, args.part, input_path=input_path)
+    print(json.dumps(response))
+    if response.get("error"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,23 @@
 #!/usr/bin/env python
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import itertools
-from typing import Generator
+import os
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import loader
 
 
 def main():
-    depths = list(read_input())
-    part_a = num_increasing_values(depths)
-    part_b = num_increasing_values(depths, window_length=3)
+    if os.path.getsize("day01.txt") >= loader.PARALLEL_THRESHOLD:
+        part_a, part_b = count_file_parallel()
+    else:
+        part_a, part_b = stream_file()
     print(f"{part_a=}")
     print(f"{part_b=}")
 
 
-def num_increasing_values(depths: list[int], window_length: int = 1) -> int:
+def num_increasing_values(depths: Iterable[int], window_length: int = 1) -> int:
     """
     We don't need to sum the sliding window. For a sliding window of
     length i, just count the number of positions x for which
@@ -27,13 +33,127 @@ def num_increasing_values(depths: list[int], window_length: int = 1) -> int:
 
     Comparing A = [199, 200, 208] with B = [200, 208, 210], both lists
     contain 200 and 208, so we only need to compare 199 and 210.
+
+    depths can be any iterable, and only window_length of them are held
+    in memory at once.
+    """
+    depths, ahead = itertools.tee(depths)
+    ahead = itertools.islice(ahead, window_length, None)
+    return sum(1 if b > a else 0 for a, b in zip(depths, ahead))
+
+
+def count_increases(
+    depths: Iterable[int], window_lengths: Sequence[int] = (1, 3)
+) -> list[int]:
+    """
+    num_increasing_values for several window lengths at once, in a single
+    pass over depths. Only the last max(window_lengths) depths are held,
+    in a ring buffer, so depths can be a stream of any length.
+    """
+    depths = iter(depths)
+    size = max(window_lengths)
+    window = deque(itertools.islice(depths, size), maxlen=size)
+    counts = [num_increasing_values(window, n) for n in window_lengths]
+
+    offsets = [-n for n in window_lengths]
+    for depth in depths:
+        for i, offset in enumerate(offsets):
+            if depth > window[offset]:
+                counts[i] += 1
+        window.append(depth)
+    return counts
+
+
+def iter_depths(lines: Iterable[str]) -> Iterator[int]:
+    return map(int, itertools.chain.from_iterable(map(str.split, lines)))
+
+
+def parse_input(input_str: str) -> list[int]:
+    return [int(x) for x in input_str.split()]
+
+
+def stream_file(
+    filename: loader.Source = "day01.txt", window_lengths: Sequence[int] = (1, 3)
+) -> list[int]:
+    """
+    count_increases for the depths in a file, read a line at a time, so
+    it runs in constant memory however large the file is.
+    """
+    return count_increases(iter_depths(loader.iter_lines(filename)), window_lengths)
+
+
+def count_chunk(
+    filename: str, start: int, end: int, window_lengths: Sequence[int]
+) -> list[int]:
+    """
+    count_increases for the comparisons that start in bytes start to end
+    of the file. To count the ones that end in the next chunk, the chunk
+    is followed by an overlap of the max(window_lengths) depths after it.
+    """
+    size = max(window_lengths)
+    with loader.map_file(filename) as data:
+        depths = list(map(int, data[start:end].split()))
+        num_depths = len(depths)
+
+        position = end
+        while len(depths) < num_depths + size and position < len(data):
+            line_end = data.find(b"\n", position)
+            if line_end < 0:
+                line_end = len(data)
+            depths.extend(map(int, data[position:line_end].split()))
+            position = line_end + 1
+
+    return [
+        sum(
+            1 if b > a else 0
+            for a, b in zip(
+                itertools.islice(depths, num_depths), itertools.islice(depths, n, None)
+            )
+        )
+        for n in window_lengths
+    ]
+
+
+def count_file_parallel(
+    filename: str = "day01.txt",
+    window_lengths: Sequence[int] = (1, 3),
+    max_workers: Optional[int] = None,
+    chunk_size: int = loader.CHUNK_SIZE,
+) -> list[int]:
     """
-    return sum(1 if b > a else 0 for a, b in zip(depths, depths[window_length:]))
+    count_increases for the depths in a file, split into chunks of whole
+    lines that are counted in separate processes.
+    """
+    num_workers = max_workers or os.cpu_count() or 1
+    ranges = loader.chunk_ranges(filename, num_workers, chunk_size)
+
+    totals = [0] * len(window_lengths)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for counts in executor.map(
+            count_chunk,
+            itertools.repeat(filename),
+            (start for start, end in ranges),
+            (end for start, end in ranges),
+            itertools.repeat(window_lengths),
+        ):
+            totals = [total + count for total, count in zip(totals, counts)]
+    return totals
+
+
+def solve_part_1(depths: Sequence[int]) -> int:
+    return num_increasing_values(depths)
+
+
+def solve_part_2(depths: Sequence[int]) -> int:
+    return num_increasing_values(depths, window_length=3)
+
+
+def solve(depths: Sequence[int]) -> Tuple[int, int]:
+    return solve_part_1(depths), solve_part_2(depths)
 
 
-def read_input() -> Generator[int, None, None]:
-    with open("day01.txt") as f:
-        return (int(x) for x in f.readlines())
+def read_input(filename: str = "day01.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,23 @@
 #!/usr/bin/env python
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import itertools
+import os
+from typing import Iterable, Optional, Tuple
+
+import loader
+
+# The change in horizontal position, aim and depth made by a run of
+# commands, starting from an aim of 0
+Summary = Tuple[int, int, int]
 
 
 def main():
-    lines = read_input()
-    part_a = do_part_a(lines)
-    part_b = do_part_b(lines)
+    if os.path.getsize("day02.txt") >= loader.PARALLEL_THRESHOLD:
+        part_a, part_b = solve_file_parallel()
+    else:
+        lines = parse_input(read_input())
+        part_a, part_b = solve(lines)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
@@ -41,9 +53,91 @@ def do_part_b(lines: list[str]) -> int:
     return horizontal * depth
 
 
-def read_input() -> list[str]:
-    with open("day02.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> list[str]:
+    return input_str.splitlines()
+
+
+def solve_part_1(lines: list[str]) -> int:
+    return do_part_a(lines)
+
+
+def solve_part_2(lines: list[str]) -> int:
+    return do_part_b(lines)
+
+
+def summarise(lines: Iterable[str]) -> Summary:
+    horizontal, aim, depth = 0, 0, 0
+    for line in lines:
+        instruction, num_str = line.split()
+        num = int(num_str)
+        if instruction == "forward":
+            horizontal += num
+            depth += num * aim
+        elif instruction == "down":
+            aim += num
+        else:
+            aim -= num
+
+    return horizontal, aim, depth
+
+
+def compose(first: Summary, second: Summary) -> Summary:
+    """
+    The summary of the commands of first followed by those of second.
+    Every forward in second goes deeper by the aim that first ended with,
+    as well as by second's own aim.
+    """
+    horizontal_1, aim_1, depth_1 = first
+    horizontal_2, aim_2, depth_2 = second
+    return (
+        horizontal_1 + horizontal_2,
+        aim_1 + aim_2,
+        depth_1 + depth_2 + aim_1 * horizontal_2,
+    )
+
+
+def answers(summary: Summary) -> Tuple[int, int]:
+    # The depth in part 1 changes in exactly the same way as the aim does
+    # in part 2
+    horizontal, aim, depth = summary
+    return horizontal * aim, horizontal * depth
+
+
+def solve(lines: list[str]) -> Tuple[int, int]:
+    """Both parts in one pass."""
+    return answers(summarise(lines))
+
+
+def summarise_chunk(filename: str, start: int, end: int) -> Summary:
+    with loader.map_file(filename) as data:
+        return summarise(data[start:end].decode().splitlines())
+
+
+def solve_file_parallel(
+    filename: str = "day02.txt",
+    max_workers: Optional[int] = None,
+    chunk_size: int = loader.CHUNK_SIZE,
+) -> Tuple[int, int]:
+    """
+    Both parts for a file, split into chunks of whole lines that are
+    summarised in separate processes. Composing the summaries in order
+    gives the summary of the whole file.
+    """
+    num_workers = max_workers or os.cpu_count() or 1
+    ranges = loader.chunk_ranges(filename, num_workers, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        summaries = executor.map(
+            summarise_chunk,
+            itertools.repeat(filename),
+            (start for start, end in ranges),
+            (end for start, end in ranges),
+        )
+        return answers(functools.reduce(compose, summaries, (0, 0, 0)))
+
+
+def read_input(filename: str = "day02.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
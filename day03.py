@@ -1,14 +1,55 @@
 #!/usr/bin/env python
+import bisect
+from dataclasses import dataclass
 import itertools
+import re
+import sys
+from typing import AnyStr, Iterable, Optional, Sequence, Tuple
 
+import engines
+import loader
 
-def main():
-    lines = read_input()
-    numbers = [int(line, 2) for line in lines]
-    num_bits = max(len(line.strip()) for line in lines)
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None  # type: ignore
+
+ONE = ord("1")
+NEWLINE = ord("\n")
+
+UNEVEN_LINES = "The lines of the report aren't all the same length"
+
+# Rows of the bit matrix that numpy compares at a time, which bounds the
+# memory used however long the report is
+BLOCK_ROWS = 1 << 20
+
+
+@dataclass
+class Report:
+    numbers: list[int]
+    num_bits: int
+    # The text the numbers were parsed from, if there was any, which the
+    # ones in each column can be counted straight from. This is the
+    # caller's string rather than a copy, and it isn't pickled, so cached
+    # reports don't hold the input twice.
+    text: Optional[str] = None
+
+    def __getstate__(self) -> dict:
+        return {**self.__dict__, "text": None}
 
-    part_a = do_part_a(numbers, num_bits)
-    part_b = do_part_b(numbers, num_bits)
+
+def main():
+    # Part 1 only needs the number of ones in each column, which can be
+    # counted straight from the bytes of the file
+    with loader.open_bytes("day03.txt") as data:
+        try:
+            part_a: Optional[int] = power_consumption(*count_columns(data))
+        except ValueError:
+            part_a = None
+    report = parse_file()
+    if part_a is None:
+        part_a = solve_part_1(report)
+    part_b = solve_part_2_sorted(report)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
@@ -19,6 +60,100 @@ def do_part_a(numbers: list[int], num_bits: int) -> int:
     return gamma * epsilon
 
 
+def power_consumption(column_counts: Sequence[int], num_numbers: int) -> int:
+    """
+    do_part_a from the number of ones in each column, most significant
+    bit first.
+    """
+    gamma = 0
+    for num_ones in column_counts:
+        gamma = gamma << 1 | (1 if num_ones >= num_numbers - num_ones else 0)
+    epsilon = gamma ^ 2 ** len(column_counts) - 1
+    return gamma * epsilon
+
+
+def count_columns(data: bytes, use_numpy: bool = True) -> Tuple[list[int], int]:
+    """
+    The number of ones in each column of a report, most significant bit
+    first, and the number of lines, counted straight from its bytes
+    rather than from parsed numbers. This works for any number of bits.
+    numpy is used if it's installed and use_numpy is set.
+    Raises ValueError unless every line is the same length.
+    """
+    if len(data) == 0:
+        return [], 0
+    width = line_length(data)
+    stride = width + 1
+    width = len(bytes(data[:width]).rstrip(b"\r"))
+
+    num_full_rows, remainder = divmod(len(data), stride)
+    # Only the last line can be missing its line ending, and every line
+    # ending must be where a line of the first line's length would end
+    if (
+        width == 0
+        or remainder not in (0, width)
+        or bytes(data[stride - 1 :: stride]).count(NEWLINE) != num_full_rows
+    ):
+        raise ValueError(UNEVEN_LINES)
+    num_numbers = num_full_rows + (1 if remainder else 0)
+
+    if numpy is None or not use_numpy:
+        # Slicing with a step and counting both happen in C
+        counts = []
+        for i in range(width):
+            column = bytes(data[i::stride])
+            # A shorter line, which the check above can't see if a longer
+            # one made up for it
+            if NEWLINE in column:
+                raise ValueError(UNEVEN_LINES)
+            counts.append(column.count(ONE))
+        return counts, num_numbers
+
+    array = numpy.frombuffer(data, dtype=numpy.uint8)
+    counts = numpy.zeros(width, dtype=numpy.int64)
+    for start in range(0, num_full_rows, BLOCK_ROWS):
+        num_rows = min(BLOCK_ROWS, num_full_rows - start)
+        block = array[start * stride : (start + num_rows) * stride]
+        bits = block.reshape(num_rows, stride)[:, :width]
+        if (bits == NEWLINE).any():
+            raise ValueError(UNEVEN_LINES)
+        counts += numpy.count_nonzero(bits == ONE, axis=0)
+    # The last line, if it has no line ending
+    if remainder:
+        last_row = array[num_full_rows * stride :]
+        if (last_row == NEWLINE).any():
+            raise ValueError(UNEVEN_LINES)
+        counts += last_row == ONE
+    return [int(count) for count in counts], num_numbers
+
+
+def line_length(data: bytes) -> int:
+    """The length of the first line, without reading any more than that."""
+    piece_size = 4096
+    for start in range(0, len(data), piece_size):
+        end = bytes(data[start : start + piece_size]).find(b"\n")
+        if end >= 0:
+            return start + end
+    return len(data)
+
+
+def report_bytes(numbers: Iterable[int], num_bits: int) -> bytes:
+    return "".join(f"{x:0{num_bits}b}\n" for x in numbers).encode()
+
+
+def report_columns(report: Report, use_numpy: bool = True) -> Tuple[list[int], int]:
+    """
+    count_columns for a parsed report, from its text if it has any and the
+    lines are all the same length, or else from its numbers.
+    """
+    if report.text is not None:
+        try:
+            return count_columns(report.text.encode(), use_numpy)
+        except ValueError:
+            pass
+    return count_columns(report_bytes(report.numbers, report.num_bits), use_numpy)
+
+
 def do_part_b(numbers: list[int], num_bits: int) -> int:
     o2 = get_gas_number(numbers, num_bits, o2=True)
     co2 = get_gas_number(numbers, num_bits, o2=False)
@@ -39,6 +174,38 @@ def get_gas_number(numbers, num_bits, o2=True):
     return numbers[0]
 
 
+def do_part_b_sorted(numbers: list[int], num_bits: int) -> int:
+    numbers = sorted(numbers)
+    o2 = get_rating(numbers, num_bits, most_common=True)
+    co2 = get_rating(numbers, num_bits, most_common=False)
+    return o2 * co2
+
+
+def get_rating(sorted_numbers: Sequence[int], num_bits: int, most_common: bool) -> int:
+    """
+    get_gas_number for numbers that have already been sorted. The numbers
+    that share the bits kept so far are always a range of sorted_numbers,
+    and the next bit splits that range in two at a point that can be
+    found by bisection, so no numbers are copied or counted one by one.
+    """
+    start, end = 0, len(sorted_numbers)
+    prefix = 0
+    bit = num_bits
+    while end - start > 1 and bit > 0:
+        bit -= 1
+        split = bisect.bisect_left(sorted_numbers, prefix | 1 << bit, start, end)
+        num_zeros, num_ones = split - start, end - split
+        if (num_ones >= num_zeros) == most_common:
+            start = split
+            prefix |= 1 << bit
+        else:
+            end = split
+
+    if start == end:
+        raise ValueError("Every number was filtered out")
+    return sorted_numbers[start]
+
+
 def get_gamma_bit(numbers: list[int], bit: int) -> int:
     num_ones = len([x for x in numbers if x & 2**bit])
     if num_ones >= len(numbers) - num_ones:
@@ -47,9 +214,59 @@ def get_gamma_bit(numbers: list[int], bit: int) -> int:
         return 0
 
 
-def read_input() -> list[str]:
-    with open("day03.txt") as f:
-        return f.readlines()
+def parse_lines(lines: Iterable[AnyStr]) -> Tuple[list[int], int]:
+    numbers = []
+    num_bits = 0
+    for line in lines:
+        numbers.append(int(line, 2))
+        num_bits = max(num_bits, len(line))
+    return numbers, num_bits
+
+
+def parse_input(input_str: str) -> Report:
+    numbers, num_bits = parse_lines(m[0] for m in re.finditer(r"[01]+", input_str))
+    return Report(numbers, num_bits, input_str)
+
+
+def parse_file(filename: str = "day03.txt") -> Report:
+    # Lines are parsed one at a time from the mapped file, so the only
+    # copy of the input that's kept is the numbers
+    with loader.open_bytes(filename) as data:
+        return Report(*parse_lines(m[0] for m in re.finditer(rb"[01]+", data)))
+
+
+@engines.register("part_1", engines.REFERENCE)
+def solve_part_1(report: Report) -> int:
+    return do_part_a(report.numbers, report.num_bits)
+
+
+@engines.register("part_1", engines.OPTIMISED)
+def solve_part_1_columns(report: Report) -> int:
+    return power_consumption(*report_columns(report, use_numpy=False))
+
+
+@engines.register("part_1", engines.VECTORISED, available=numpy is not None)
+def solve_part_1_numpy(report: Report) -> int:
+    return power_consumption(*report_columns(report))
+
+
+@engines.register("part_2", engines.REFERENCE)
+def solve_part_2(report: Report) -> int:
+    return do_part_b(report.numbers, report.num_bits)
+
+
+@engines.register("part_2", engines.OPTIMISED)
+def solve_part_2_sorted(report: Report) -> int:
+    return do_part_b_sorted(report.numbers, report.num_bits)
+
+
+def solve(report: Report) -> Tuple[int, int]:
+    solve_part_1_fastest = engines.select(sys.modules[__name__], "part_1")
+    return solve_part_1_fastest(report), solve_part_2_sorted(report)
+
+
+def read_input(filename: str = "day03.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,21 @@
 #!/usr/bin/env python
+from collections import defaultdict
 from dataclasses import dataclass, field
 from itertools import zip_longest
-from typing import Iterable
+from typing import Iterable, Iterator, Tuple
+
+import engines
+import loader
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None  # type: ignore
+
+Game = Tuple[list["BingoCard"], list[int]]
+
+# Where a number is on the cards, as (card, row, column)
+Index = dict[int, list[Tuple[int, int, int]]]
 
 
 @dataclass
@@ -42,18 +56,14 @@ def grouper(iterable, n, fillvalue=None) -> Iterable:
 def generate_cards(lines: list[str]) -> list[BingoCard]:
     cards = []
     for card_lines in grouper(lines, 6, fillvalue=""):
-        card_numbers = [int(x) for x in "".join(card_lines).split()]
+        card_numbers = [int(x) for x in " ".join(card_lines).split()]
         cards.append(BingoCard(card_numbers))
     return cards
 
 
 def main():
-    lines = read_input()
-    numbers = [int(x) for x in lines[0].split(",")]
-    cards = generate_cards(lines[2:])
-
-    part_a = do_part_a(cards, numbers)
-    part_b = do_part_b(cards, numbers)
+    game = parse_input(read_input())
+    part_a, part_b = solve(game)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
@@ -81,9 +91,198 @@ def do_part_b(cards: list[BingoCard], numbers: list[int]) -> int:
     raise AssertionError("Reached end of numbers without completing a card")
 
 
-def read_input() -> list[str]:
-    with open("day04.txt") as f:
-        return f.readlines()
+def index_cards(cards: list[BingoCard]) -> Index:
+    index: Index = defaultdict(list)
+    for card_index, card in enumerate(cards):
+        for position, number in enumerate(card.numbers):
+            row, column = divmod(position, 5)
+            index[number].append((card_index, row, column))
+    return index
+
+
+def winners(cards: list[BingoCard], numbers: list[int]) -> Iterator[Tuple[int, int]]:
+    """
+    The index and score of each card as it is completed, in the same
+    order as do_part_a and do_part_b find them. Each number drawn only
+    touches the places it appears on the cards, where it adds one to the
+    count of numbers marked in that row and column. A card is complete
+    when one of those counts reaches 5. The cards are left unmarked.
+    """
+    index = index_cards(cards)
+    row_counts = [0] * (5 * len(cards))
+    column_counts = [0] * (5 * len(cards))
+    unmarked_sums = [sum(card.numbers) for card in cards]
+    finished = [False] * len(cards)
+    drawn = set()
+
+    for n in numbers:
+        if n in drawn:
+            continue
+        drawn.add(n)
+        for card_index, row, column in index.get(n, ()):
+            if finished[card_index]:
+                continue
+            unmarked_sums[card_index] -= n
+            row_counts[5 * card_index + row] += 1
+            column_counts[5 * card_index + column] += 1
+            if (
+                row_counts[5 * card_index + row] == 5
+                or column_counts[5 * card_index + column] == 5
+            ):
+                finished[card_index] = True
+                yield card_index, unmarked_sums[card_index] * n
+
+
+def do_part_a_indexed(cards: list[BingoCard], numbers: list[int]) -> int:
+    for card_index, score in winners(cards, numbers):
+        return score
+    raise AssertionError("Reached end of numbers without completing a card")
+
+
+def do_part_b_indexed(cards: list[BingoCard], numbers: list[int]) -> int:
+    num_completed = 0
+    for card_index, score in winners(cards, numbers):
+        num_completed += 1
+        if num_completed == len(cards):
+            return score
+    raise AssertionError("Reached end of numbers without completing a card")
+
+
+def completion_turns(
+    cards: list[BingoCard], numbers: list[int], use_numpy: bool = True
+) -> list[int]:
+    """
+    The index in numbers of the draw that completes each card, or
+    len(numbers) if it's never completed, worked out directly rather
+    than by playing the game. With each number ranked by when it's
+    drawn, a line is complete at the highest rank of its numbers, and a
+    card at the lowest of those over its rows and columns. numpy is used
+    for all the cards at once if it's installed and use_numpy is set.
+    """
+    never = len(numbers)
+    if not cards:
+        return []
+
+    if numpy is not None and use_numpy:
+        highest = max(max(numbers, default=0), max(max(c.numbers) for c in cards))
+        ranks = numpy.full(highest + 1, never)
+        # Assign in reverse, so that a number drawn twice keeps its first rank
+        ranks[numpy.array(numbers[::-1], dtype=int)] = numpy.arange(never)[::-1]
+        grids = ranks[numpy.array([card.numbers for card in cards])].reshape(-1, 5, 5)
+        row_turns = grids.max(axis=2).min(axis=1)
+        column_turns = grids.max(axis=1).min(axis=1)
+        return numpy.minimum(row_turns, column_turns).tolist()
+
+    rank: dict[int, int] = {}
+    for i, n in enumerate(numbers):
+        rank.setdefault(n, i)
+    turns = []
+    for card in cards:
+        grid = [rank.get(x, never) for x in card.numbers]
+        lines = [grid[x : x + 5] for x in range(0, 25, 5)] + [
+            grid[x::5] for x in range(5)
+        ]
+        turns.append(min(max(line) for line in lines))
+    return turns
+
+
+def score_at(card: BingoCard, numbers: list[int], turn: int) -> int:
+    drawn = set(numbers[: turn + 1])
+    return sum(x for x in card.numbers if x not in drawn) * numbers[turn]
+
+
+def first_completed(turns: list[int], never: int) -> int:
+    # Of the cards completed on the same draw, the first one wins
+    first = min(range(len(turns)), key=turns.__getitem__, default=None)
+    if first is None or turns[first] == never:
+        raise AssertionError("Reached end of numbers without completing a card")
+    return first
+
+
+def last_completed(turns: list[int], never: int) -> int:
+    # Of the cards completed on the same draw, the last one is last
+    last = max(reversed(range(len(turns))), key=turns.__getitem__, default=None)
+    if last is None or turns[last] == never:
+        raise AssertionError("Reached end of numbers without completing a card")
+    return last
+
+
+def do_part_a_ranked(
+    cards: list[BingoCard], numbers: list[int], use_numpy: bool = True
+) -> int:
+    turns = completion_turns(cards, numbers, use_numpy)
+    first = first_completed(turns, len(numbers))
+    return score_at(cards[first], numbers, turns[first])
+
+
+def do_part_b_ranked(
+    cards: list[BingoCard], numbers: list[int], use_numpy: bool = True
+) -> int:
+    turns = completion_turns(cards, numbers, use_numpy)
+    last = last_completed(turns, len(numbers))
+    return score_at(cards[last], numbers, turns[last])
+
+
+def parse_input(input_str: str) -> Game:
+    lines = input_str.splitlines()
+    numbers = [int(x) for x in lines[0].split(",")]
+    cards = generate_cards(lines[2:])
+    return cards, numbers
+
+
+@engines.register("part_1", engines.REFERENCE)
+def solve_part_1(game: Game) -> int:
+    cards, numbers = game
+    return do_part_a(cards, numbers)
+
+
+@engines.register("part_1", engines.OPTIMISED)
+def solve_part_1_indexed(game: Game) -> int:
+    cards, numbers = game
+    return do_part_a_indexed(cards, numbers)
+
+
+@engines.register("part_2", engines.REFERENCE)
+def solve_part_2(game: Game) -> int:
+    cards, numbers = game
+    return do_part_b(cards, numbers)
+
+
+@engines.register("part_2", engines.OPTIMISED)
+def solve_part_2_indexed(game: Game) -> int:
+    cards, numbers = game
+    return do_part_b_indexed(cards, numbers)
+
+
+@engines.register("part_1", engines.VECTORISED, available=numpy is not None)
+def solve_part_1_ranked(game: Game) -> int:
+    cards, numbers = game
+    return do_part_a_ranked(cards, numbers)
+
+
+@engines.register("part_2", engines.VECTORISED, available=numpy is not None)
+def solve_part_2_ranked(game: Game) -> int:
+    cards, numbers = game
+    return do_part_b_ranked(cards, numbers)
+
+
+def solve(game: Game) -> Tuple[int, int]:
+    """
+    The first and last cards to be completed, from when every card is
+    completed, without playing the game or marking the cards.
+    """
+    cards, numbers = game
+    turns = completion_turns(cards, numbers)
+    first = first_completed(turns, len(numbers))
+    last = last_completed(turns, len(numbers))
+    return (
+        score_at(cards[first], numbers, turns[first]),
+        score_at(cards[last], numbers, turns[last]),
+    )
+
+
+def read_input(filename: str = "day04.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,28 @@
 #!/usr/bin/env python
-from collections import Counter
-from typing import Mapping, Tuple
+import bisect
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+import math
+import sys
+from typing import Iterable, Iterator, Mapping, Optional, Tuple
 import re
 
+import engines
+import loader
+import parts
+
+INDEPENDENT_PARTS = True
+
 Point = Tuple[int, int]
+Interval = Tuple[int, int]
+
+# The directions a line can go in, as (a, b) such that a*x + b*y is the
+# same at every point of the line. That value is the line's key.
+Direction = Tuple[int, int]
+HORIZONTAL: Direction = (0, 1)
+VERTICAL: Direction = (1, 0)
+UP: Direction = (-1, 1)
+DOWN: Direction = (1, 1)
 
 regex = re.compile(r"^(\d+),(\d+) -> (\d+),(\d+)")
 
@@ -17,58 +36,270 @@ def parse_line(line: str) -> Tuple[Point, Point]:
 
 
 def main():
-    lines = [parse_line(line) for line in read_input()]
-    part_a = do_part_a(lines)
-    part_b = do_part_b(lines)
+    lines = parse_input(read_input())
+    part_a, part_b = parts.solve(sys.modules[__name__], lines)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
 
 def do_part_a(lines: list[Tuple[Point, Point]]) -> int:
     grid = calc_grid(lines, include_diagonals=False)
-    intersected_points = [key for key, count in grid.items() if count > 1]
-    return len(intersected_points)
+    return count_intersected_points(grid)
 
 
 def do_part_b(lines: list[Tuple[Point, Point]]) -> int:
     grid = calc_grid(lines, include_diagonals=True)
+    return count_intersected_points(grid)
+
+
+def count_intersected_points(grid: Mapping[Point, int]) -> int:
     intersected_points = [key for key, count in grid.items() if count > 1]
     return len(intersected_points)
 
 
+def is_diagonal(line: Tuple[Point, Point]) -> bool:
+    (x1, y1), (x2, y2) = line
+    return x1 != x2 and y1 != y2
+
+
+def line_points(line: Tuple[Point, Point]) -> Iterator[Point]:
+    (x1, y1), (x2, y2) = line
+    if x1 < x2:
+        x_step = 1
+    elif x1 == x2:
+        x_step = 0
+    else:
+        x_step = -1
+
+    if y1 < y2:
+        y_step = 1
+    elif y1 == y2:
+        y_step = 0
+    else:
+        y_step = -1
+
+    length = max(abs(n) for n in (x2 - x1, y2 - y1))
+
+    return ((x1 + n * x_step, y1 + n * y_step) for n in range(length + 1))
+
+
 def calc_grid(
     lines: list[Tuple[Point, Point]], include_diagonals: bool
-) -> Mapping[Point, int]:
+) -> Counter[Point]:
     grid: Counter[Point] = Counter()
 
-    for (x1, y1), (x2, y2) in lines:
-        if x1 < x2:
-            x_step = 1
-        elif x1 == x2:
-            x_step = 0
-        else:
-            x_step = -1
-
-        if y1 < y2:
-            y_step = 1
-        elif y1 == y2:
-            y_step = 0
-        else:
-            y_step = -1
-
-        if (x_step != 0 and y_step != 0) and not include_diagonals:
+    for line in lines:
+        if is_diagonal(line) and not include_diagonals:
             # Skip diagonal line
             continue
 
-        length = max(abs(n) for n in (x2 - x1, y2 - y1))
-
-        grid.update((x1 + n * x_step, y1 + n * y_step) for n in range(length + 1))
+        grid.update(line_points(line))
     return grid
 
 
-def read_input() -> list[str]:
-    with open("day05.txt") as f:
-        return f.readlines()
+def direction(line: Tuple[Point, Point]) -> Direction:
+    (x1, y1), (x2, y2) = line
+    if y1 == y2:
+        return HORIZONTAL
+    if x1 == x2:
+        return VERTICAL
+    if abs(x2 - x1) != abs(y2 - y1):
+        raise ValueError(f"Line {line} isn't horizontal, vertical or diagonal")
+    return UP if x2 - x1 == y2 - y1 else DOWN
+
+
+def line_key(direction: Direction, point: Point) -> int:
+    a, b = direction
+    x, y = point
+    return a * x + b * y
+
+
+def position(direction: Direction, point: Point) -> int:
+    """Where a point is along a line going in direction."""
+    x, y = point
+    return y if direction == VERTICAL else x
+
+
+def point_at(direction: Direction, key: int, t: int) -> Point:
+    if direction == VERTICAL:
+        return key, t
+    a, b = direction
+    return t, key - a * t
+
+
+def crossing(
+    direction_1: Direction, key_1: int, direction_2: Direction, key_2: int
+) -> Optional[Point]:
+    """Where two lines going in different directions cross, if on a point."""
+    a1, b1 = direction_1
+    a2, b2 = direction_2
+    determinant = a1 * b2 - a2 * b1
+    x, x_remainder = divmod(key_1 * b2 - key_2 * b1, determinant)
+    y, y_remainder = divmod(a1 * key_2 - a2 * key_1, determinant)
+    if x_remainder or y_remainder:
+        return None
+    return x, y
+
+
+def coverage(intervals: Iterable[Interval]) -> Tuple[list[Interval], list[Interval]]:
+    """
+    The ranges covered by at least one of intervals, and those covered by
+    at least two, both as sorted lists of disjoint, inclusive intervals.
+    """
+    events = []
+    for start, end in intervals:
+        events.append((start, 1))
+        events.append((end + 1, -1))
+    events.sort()
+
+    covered: list[Interval] = []
+    overlapped: list[Interval] = []
+    depth = 0
+    starts = [0, 0, 0]
+    for t, change in events:
+        depth += change
+        if change == 1 and depth <= 2:
+            starts[depth] = t
+        elif change == -1 and depth < 2:
+            covered_by = overlapped if depth == 1 else covered
+            covered_by.append((starts[depth + 1], t - 1))
+    return covered, overlapped
+
+
+def covers(intervals: list[Interval], t: int) -> bool:
+    i = bisect.bisect_right(intervals, (t, math.inf)) - 1
+    return i >= 0 and intervals[i][1] >= t
+
+
+@dataclass
+class Family:
+    """The lines going in one direction, grouped by their keys."""
+
+    direction: Direction
+    covered: dict[int, list[Interval]] = field(default_factory=dict)
+    overlapped: dict[int, list[Interval]] = field(default_factory=dict)
+
+    def num_overlapped(self) -> int:
+        return sum(
+            end - start + 1
+            for intervals in self.overlapped.values()
+            for start, end in intervals
+        )
+
+    def overlaps(self, point: Point) -> bool:
+        intervals = self.overlapped.get(line_key(self.direction, point))
+        if not intervals:
+            return False
+        return covers(intervals, position(self.direction, point))
+
+    def crossings(self, other: "Family") -> Iterator[Point]:
+        """The points covered by lines of both families."""
+        other_keys = sorted(other.covered)
+        for key, intervals in self.covered.items():
+            for start, end in intervals:
+                # The key of the other family's lines changes steadily
+                # along this line, so only those with a key between its
+                # values at the two ends can cross it
+                ends = (point_at(self.direction, key, t) for t in (start, end))
+                low, high = sorted(line_key(other.direction, p) for p in ends)
+                first = bisect.bisect_left(other_keys, low)
+                last = bisect.bisect_right(other_keys, high)
+                for other_key in other_keys[first:last]:
+                    point = crossing(self.direction, key, other.direction, other_key)
+                    if point is not None and covers(
+                        other.covered[other_key], position(other.direction, point)
+                    ):
+                        yield point
+
+
+def make_families(lines: list[Tuple[Point, Point]]) -> dict[Direction, Family]:
+    intervals: dict[Direction, dict[int, list[Interval]]] = {
+        d: defaultdict(list) for d in (HORIZONTAL, VERTICAL, UP, DOWN)
+    }
+    for line in lines:
+        d = direction(line)
+        start, end = sorted(position(d, point) for point in line)
+        intervals[d][line_key(d, line[0])].append((start, end))
+
+    families = {}
+    for d, by_key in intervals.items():
+        family = Family(d)
+        for key, key_intervals in by_key.items():
+            covered, overlapped = coverage(key_intervals)
+            family.covered[key] = covered
+            if overlapped:
+                family.overlapped[key] = overlapped
+        families[d] = family
+    return families
+
+
+def count_overlaps(families: list[Family]) -> int:
+    """
+    The number of points covered by at least two lines, without visiting
+    every point of every line. The points covered twice by lines going in
+    the same direction are counted from the overlaps of their intervals.
+    The only other points covered twice are where lines going in
+    different directions cross, and each of those is counted once,
+    however many of the families' overlaps it's in.
+    """
+    crossings: set[Point] = set()
+    for i, family in enumerate(families):
+        for other in families[i + 1 :]:
+            crossings.update(family.crossings(other))
+
+    count = sum(family.num_overlapped() for family in families) + len(crossings)
+    for family in families:
+        if family.overlapped:
+            count -= sum(1 for point in crossings if family.overlaps(point))
+    return count
+
+
+def do_part_a_analytic(lines: list[Tuple[Point, Point]]) -> int:
+    families = make_families(lines)
+    return count_overlaps([families[HORIZONTAL], families[VERTICAL]])
+
+
+def do_part_b_analytic(lines: list[Tuple[Point, Point]]) -> int:
+    return count_overlaps(list(make_families(lines).values()))
+
+
+def parse_input(input_str: str) -> list[Tuple[Point, Point]]:
+    return [parse_line(line) for line in input_str.splitlines()]
+
+
+@engines.register("part_1", engines.REFERENCE)
+def solve_part_1(lines: list[Tuple[Point, Point]]) -> int:
+    return do_part_a(lines)
+
+
+@engines.register("part_1", engines.OPTIMISED)
+def solve_part_1_analytic(lines: list[Tuple[Point, Point]]) -> int:
+    return do_part_a_analytic(lines)
+
+
+@engines.register("part_2", engines.REFERENCE)
+def solve_part_2(lines: list[Tuple[Point, Point]]) -> int:
+    return do_part_b(lines)
+
+
+@engines.register("part_2", engines.OPTIMISED)
+def solve_part_2_analytic(lines: list[Tuple[Point, Point]]) -> int:
+    return do_part_b_analytic(lines)
+
+
+def solve(lines: list[Tuple[Point, Point]]) -> Tuple[int, int]:
+    """
+    Both parts from one set of families: the straight lines first, then
+    the diagonal ones as well.
+    """
+    families = make_families(lines)
+    straight = [families[HORIZONTAL], families[VERTICAL]]
+    diagonal = [families[UP], families[DOWN]]
+    return count_overlaps(straight), count_overlaps(straight + diagonal)
+
+
+def read_input(filename: str = "day05.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 from collections import Counter
+from typing import Tuple
+
+import loader
 
 
 def main():
-    fish = read_input()
-    part_a = calc_fish_after_days(fish, 80)
-    part_b = calc_fish_after_days(fish, 256)
+    fish = parse_input(read_input())
+    part_a, part_b = solve(fish)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
@@ -29,9 +31,34 @@ def calc_fish_after_days(fish: list[int], days: int) -> int:
     return sum(totals.values())
 
 
-def read_input() -> list[int]:
-    with open("day06.txt") as f:
-        return [int(x) for x in f.read().split(",")]
+def parse_input(input_str: str) -> list[int]:
+    return [int(x) for x in input_str.split(",")]
+
+
+def solve_part_1(fish: list[int]) -> int:
+    return calc_fish_after_days(fish, 80)
+
+
+def solve_part_2(fish: list[int]) -> int:
+    return calc_fish_after_days(fish, 256)
+
+
+def solve(fish: list[int]) -> Tuple[int, int]:
+    """Carry on from day 80 to day 256, rather than starting again."""
+    totals = dict(Counter(fish))
+
+    for _ in range(80):
+        totals = do_day(totals)
+    part_a = sum(totals.values())
+
+    for _ in range(256 - 80):
+        totals = do_day(totals)
+
+    return part_a, sum(totals.values())
+
+
+def read_input(filename: str = "day06.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,17 @@
 #!/usr/bin/env python
 from collections import Counter
+import sys
+from typing import Tuple
+
+import loader
+import parts
+
+INDEPENDENT_PARTS = True
 
 
 def main():
-    numbers = read_input()
-    part_a = calc_minimum(numbers, lambda n, x: abs(n - x))
-    part_b = calc_minimum(numbers, lambda n, x: abs(n - x) * (abs(n - x) + 1) // 2)
+    numbers = parse_input(read_input())
+    part_a, part_b = parts.solve(sys.modules[__name__], numbers)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
@@ -17,9 +23,24 @@ def calc_minimum(numbers: list[int], func) -> int:
     return min(sum([func(n, x) for x in numbers]) for n in range(n_min, n_max + 1))
 
 
-def read_input() -> list[int]:
-    with open("day07.txt") as f:
-        return [int(x) for x in f.read().split(",")]
+def parse_input(input_str: str) -> list[int]:
+    return [int(x) for x in input_str.split(",")]
+
+
+def solve_part_1(numbers: list[int]) -> int:
+    return calc_minimum(numbers, lambda n, x: abs(n - x))
+
+
+def solve_part_2(numbers: list[int]) -> int:
+    return calc_minimum(numbers, lambda n, x: abs(n - x) * (abs(n - x) + 1) // 2)
+
+
+def solve(numbers: list[int]) -> Tuple[int, int]:
+    return solve_part_1(numbers), solve_part_2(numbers)
+
+
+def read_input(filename: str = "day07.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
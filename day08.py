@@ -1,8 +1,12 @@
 #!/usr/bin/env python
+from typing import Tuple
+
+import loader
+
+
 def main():
-    lines = read_input()
-    part_a = do_part_a(lines)
-    part_b = do_part_b(lines)
+    lines = parse_input(read_input())
+    part_a, part_b = solve(lines)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
@@ -66,9 +70,24 @@ def do_part_b(lines: list[str]) -> int:
     return sum([calc_signal_output(line) for line in lines])
 
 
-def read_input() -> list[str]:
-    with open("day08.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> list[str]:
+    return input_str.splitlines()
+
+
+def solve_part_1(lines: list[str]) -> int:
+    return do_part_a(lines)
+
+
+def solve_part_2(lines: list[str]) -> int:
+    return do_part_b(lines)
+
+
+def solve(lines: list[str]) -> Tuple[int, int]:
+    return solve_part_1(lines), solve_part_2(lines)
+
+
+def read_input(filename: str = "day08.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,71 +1,85 @@
 #!/usr/bin/env python
 import math
-from typing import Mapping, Tuple
+from typing import Optional, Tuple
 
-Point = Tuple[int, int]
-Grid = Mapping[Point, int]
+from grid import Grid
+import loader
 
 
 def main():
-    lines = read_input()
-    rows = [[int(x) for x in line.strip()] for line in lines]
-
-    grid = {}
-    for j, row in enumerate(rows):
-        for i, height in enumerate(row):
-            grid[(i, j)] = height
-
-    part_a = do_part_a(grid)
-    part_b = do_part_b(grid)
+    grid = parse_input(read_input())
+    part_a, part_b = solve(grid)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
 
-def neighbours(x: int, y: int) -> set[Point]:
-    return {
-        (x, y + 1),
-        (x + 1, y),
-        (x, y - 1),
-        (x - 1, y),
-    }
+# The height of the border around the grid, which is never part of a basin
+# and is higher than every low point
+BORDER = 9
 
 
-def get_basin(grid: Grid, x: int, y: int) -> set[Point]:
+def get_basin(grid: Grid, point: int) -> set[int]:
+    offsets = grid.neighbour_offsets()
+    cells = grid.cells
     basin = set()
-    queue = [(x, y)]
+    queue = [point]
     while queue:
-        (x, y) = queue.pop()
-        basin.add((x, y))
+        point = queue.pop()
+        basin.add(point)
         queue.extend(
-            [n for n in neighbours(x, y) if grid.get(n, 9) < 9 and n not in basin]
+            [
+                point + offset
+                for offset in offsets
+                if cells[point + offset] < 9 and point + offset not in basin
+            ]
         )
 
     return basin
 
 
-def get_lowest_points(grid: Grid) -> set[Point]:
-    return {
-        (x, y)
-        for (x, y) in grid
-        if grid[(x, y)] < min([grid.get((x, y), 10) for (x, y) in neighbours(x, y)])
-    }
+def get_lowest_points(grid: Grid) -> list[int]:
+    cells = grid.cells
+    offsets = grid.neighbour_offsets()
+    return [
+        point
+        for point in grid.interior()
+        if all(cells[point] < cells[point + offset] for offset in offsets)
+    ]
 
 
-def do_part_a(grid: Grid) -> int:
-    lowest_points = get_lowest_points(grid)
-    risk_level = sum([grid[(x, y)] + 1 for (x, y) in lowest_points])
+def do_part_a(grid: Grid, lowest_points: Optional[list[int]] = None) -> int:
+    if lowest_points is None:
+        lowest_points = get_lowest_points(grid)
+    risk_level = sum([grid[point] + 1 for point in lowest_points])
     return risk_level
 
 
-def do_part_b(grid: Grid) -> int:
-    lowest_points = get_lowest_points(grid)
-    basin_sizes = [len(get_basin(grid, x, y)) for (x, y) in lowest_points]
+def do_part_b(grid: Grid, lowest_points: Optional[list[int]] = None) -> int:
+    if lowest_points is None:
+        lowest_points = get_lowest_points(grid)
+    basin_sizes = [len(get_basin(grid, point)) for point in lowest_points]
     return math.prod(sorted(basin_sizes, reverse=True)[:3])
 
 
-def read_input() -> list[str]:
-    with open("day09.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> Grid:
+    return Grid.from_lines(input_str.splitlines()).padded(1, BORDER)
+
+
+def solve_part_1(grid: Grid) -> int:
+    return do_part_a(grid)
+
+
+def solve_part_2(grid: Grid) -> int:
+    return do_part_b(grid)
+
+
+def solve(grid: Grid) -> Tuple[int, int]:
+    lowest_points = get_lowest_points(grid)
+    return do_part_a(grid, lowest_points), do_part_b(grid, lowest_points)
+
+
+def read_input(filename: str = "day09.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterable, Union
+from typing import Iterable, Iterator, Tuple, Union
+
+import loader
 
 closing = {
     ")": "(",
@@ -68,29 +70,50 @@ def process_line(line: str) -> Union[Autocomplete, Error]:
 
 
 def main():
-    lines = read_input()
-    processed = [process_line(line) for line in lines]
-    part_a = do_part_a(processed)
-    part_b = do_part_b(processed)
+    processed = parse_file()
+    part_a, part_b = solve(processed)
     print(f"{part_a=}")
     print(f"{part_b=}")
 
 
-def do_part_a(processed: list[Union[Autocomplete, Error]]) -> int:
+def do_part_a(processed: Iterable[Union[Autocomplete, Error]]) -> int:
     scores = [x.score() for x in processed if isinstance(x, Error)]
     return sum(scores)
 
 
-def do_part_b(processed: list[Union[Autocomplete, Error]]) -> int:
+def do_part_b(processed: Iterable[Union[Autocomplete, Error]]) -> int:
     scores = [x.score() for x in processed if isinstance(x, Autocomplete)]
     scores.sort()
     median = scores[len(scores) // 2]
     return median
 
 
-def read_input() -> list[str]:
-    with open("day10.txt") as f:
-        return f.readlines()
+def process_lines(lines: Iterable[str]) -> Iterator[Union[Autocomplete, Error]]:
+    return (process_line(line) for line in lines)
+
+
+def parse_input(input_str: str) -> list[Union[Autocomplete, Error]]:
+    return list(process_lines(input_str.splitlines()))
+
+
+def parse_file(filename: str = "day10.txt") -> list[Union[Autocomplete, Error]]:
+    return list(process_lines(loader.iter_lines(filename)))
+
+
+def solve_part_1(processed: list[Union[Autocomplete, Error]]) -> int:
+    return do_part_a(processed)
+
+
+def solve_part_2(processed: list[Union[Autocomplete, Error]]) -> int:
+    return do_part_b(processed)
+
+
+def solve(processed: list[Union[Autocomplete, Error]]) -> Tuple[int, int]:
+    return solve_part_1(processed), solve_part_2(processed)
+
+
+def read_input(filename: str = "day10.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
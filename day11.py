@@ -1,110 +1,137 @@
 #!/usr/bin/env python
-from dataclasses import dataclass
-import math
-from typing import Mapping, Tuple
-
-Point = Tuple[int, int]
-GridMapping = Mapping[Point, int]
-
-
-class Grid:
-    def __init__(self, grid: GridMapping):
-        self.grid = grid
-        self.width = max(i for i, j in grid) + 1
-        self.height = max(j for i, j in grid) + 1
-
-    def __len__(self):
-        return self.width * self.height
-
-    @classmethod
-    def from_lines(cls, lines: list[str]):
-        grid = {}
-        rows = [[int(x) for x in line.strip()] for line in lines]
-        for j, row in enumerate(rows):
-            for i, height in enumerate(row):
-                grid[(i, j)] = height
-
-        return cls(grid)
-
-    def as_string(self) -> str:
-        return (
-            "\n".join(
-                " ".join(str(self.grid[(i, j)]) for i in range(self.width))
-                for j in range(self.height)
-            )
-            + "\n"
-        )
-
-    def neighbours(self, x: int, y: int) -> set[Point]:
-        points = {
-            (x, y + 1),
-            (x + 1, y + 1),
-            (x + 1, y),
-            (x + 1, y - 1),
-            (x, y - 1),
-            (x - 1, y - 1),
-            (x - 1, y),
-            (x - 1, y + 1),
-        }
-        return {p for p in points if p in self.grid}
-
-
-def do_turn(grid: Grid) -> Tuple[Grid, int]:
-    # Add one to everything
-    new_grid = {k: v + 1 for k, v in grid.grid.items()}
+import sys
+from typing import Optional, Tuple
+
+import checkpoint
+from grid import Grid
+import loader
+
 
-    while flashing := {k for k, v in new_grid.items() if v > 9}:
-        for x, y in flashing:
-            for n_x, n_y in grid.neighbours(x, y):
-                # Only increment neighbours that haven't already flashed
-                if new_grid[n_x, n_y] != 0:
-                    new_grid[n_x, n_y] += 1
-            new_grid[x, y] = 0
+# The energy of the border around the grid, which never changes
+BORDER = -1
 
-    return Grid(new_grid), len([v for v in new_grid.values() if v == 0])
+# The number of turns that part 1 counts the flashes of
+NUM_STEPS = 100
+
+
+def do_turn(grid: Grid, octopuses: list[int]) -> Tuple[Grid, int]:
+    """The grid after a turn, and its flashes. octopuses is grid.interior()."""
+    offsets = grid.neighbour_offsets(diagonals=True)
+
+    # Add one to everything
+    cells = grid.cells[:]
+    for point in octopuses:
+        cells[point] += 1
+
+    flashing = [point for point in octopuses if cells[point] > 9]
+    while flashing:
+        point = flashing.pop()
+        if cells[point] == 0:
+            continue
+        cells[point] = 0
+        for offset in offsets:
+            n = point + offset
+            # Only increment neighbours that haven't already flashed, and
+            # aren't in the border
+            if cells[n] > 0:
+                cells[n] += 1
+                if cells[n] == 10:
+                    flashing.append(n)
+
+    return grid.copy(cells), cells.count(0)
 
 
 def main():
-    lines = read_input()
-    grid = Grid.from_lines(lines)
+    grid = parse_input(read_input())
 
-    part_a = do_part_a(grid)
+    part_a, part_b = solve(grid)
     print(f"{part_a=}")
-
-    part_b = do_part_b(grid)
     print(f"{part_b=}")
 
 
 def do_part_a(grid: Grid, debug: bool = False) -> int:
-    num_steps = 100
     total_flashes = 0
+    octopuses = grid.interior()
 
-    for i in range(1, num_steps + 1):
-        grid, flashes = do_turn(grid)
+    for i in range(1, NUM_STEPS + 1):
+        grid, flashes = do_turn(grid, octopuses)
         total_flashes += flashes
 
         if debug and i % 10 == 0:
             print(f"After step {i}: {total_flashes} flashes")
-            print(grid.as_string())
+            print(grid.as_string(separator=" ") + "\n")
 
     return total_flashes
 
 
 def do_part_b(grid: Grid) -> int:
-    num_octopuses = len(grid)
-    flashes = 0
-    turns = 0
+    octopuses = grid.interior()
+
+    # The state is the grid and the number of flashes on the last turn
+    simulation = checkpoint.Simulation(
+        "day11-synchronise",
+        sys.modules[__name__],
+        grid,
+        (grid, 0),
+        lambda state: do_turn(state[0], octopuses),
+    )
+    simulation.advance_until(lambda state: state[1] == len(octopuses))
+
+    return simulation.step
+
+
+# The state of a run for both parts: the grid, the number of turns, the
+# flashes in the first NUM_STEPS of them, and the turn on which every
+# octopus first flashed at once, if it's happened yet
+SolveState = Tuple[Grid, int, int, Optional[int]]
+
+
+def solve_turn(state: SolveState, octopuses: list[int]) -> SolveState:
+    grid, turns, total_flashes, synchronised = state
+    grid, flashes = do_turn(grid, octopuses)
+    turns += 1
+    if turns <= NUM_STEPS:
+        total_flashes += flashes
+    if synchronised is None and flashes == len(octopuses):
+        synchronised = turns
+    return grid, turns, total_flashes, synchronised
+
+
+def parse_input(input_str: str) -> Grid:
+    return Grid.from_lines(input_str.splitlines()).padded(1, BORDER)
+
+
+def solve_part_1(grid: Grid) -> int:
+    return do_part_a(grid)
+
+
+def solve_part_2(grid: Grid) -> int:
+    return do_part_b(grid)
 
-    while flashes < num_octopuses:
-        grid, flashes = do_turn(grid)
-        turns += 1
 
-    return turns
+def solve(grid: Grid) -> Tuple[int, int]:
+    """
+    Both parts from a single run of turns, which goes on until the first
+    NUM_STEPS turns are done and all of the octopuses have flashed at once.
+    """
+    octopuses = grid.interior()
+    start: SolveState = (grid, 0, 0, None)
+    simulation = checkpoint.Simulation(
+        "day11-solve",
+        sys.modules[__name__],
+        grid,
+        start,
+        lambda state: solve_turn(state, octopuses),
+    )
+    _, _, total_flashes, synchronised = simulation.advance_until(
+        lambda state: state[1] >= NUM_STEPS and state[3] is not None
+    )
+    assert synchronised is not None
+    return total_flashes, synchronised
 
 
-def read_input() -> list[str]:
-    with open("day11.txt") as f:
-        return f.readlines()
+def read_input(filename: str = "day11.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
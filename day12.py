@@ -1,19 +1,22 @@
 #!/usr/bin/env python
 from collections import defaultdict
-from typing import Mapping
+import sys
+from typing import Mapping, Tuple
+
+import loader
+import parts
+
+INDEPENDENT_PARTS = True
 
 GraphType = Mapping[str, set[str]]
 Route = list[str]
 
 
 def main():
-    lines = read_input()
-    graph = make_graph(lines)
+    graph = parse_input(read_input())
 
-    part_a = do_part_a(graph)
+    part_a, part_b = parts.solve(sys.modules[__name__], graph)
     print(f"{part_a=}")
-
-    part_b = do_part_b(graph)
     print(f"{part_b=}")
 
 
@@ -68,9 +71,24 @@ def do_part_b(graph: GraphType) -> int:
     return len(routes)
 
 
-def read_input() -> list[str]:
-    with open("day12.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> GraphType:
+    return make_graph(input_str.splitlines())
+
+
+def solve_part_1(graph: GraphType) -> int:
+    return do_part_a(graph)
+
+
+def solve_part_2(graph: GraphType) -> int:
+    return do_part_b(graph)
+
+
+def solve(graph: GraphType) -> Tuple[int, int]:
+    return solve_part_1(graph), solve_part_2(graph)
+
+
+def read_input(filename: str = "day12.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
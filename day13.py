@@ -2,8 +2,11 @@
 from dataclasses import dataclass
 from typing import Literal, Tuple
 
+import loader
+
 Dot = tuple[int, int]
 Dots = set[Dot]
+Paper = tuple[Dots, list["Fold"]]
 
 
 @dataclass
@@ -18,7 +21,7 @@ def parse_fold(line: str) -> Fold:
     return Fold(axis, int(line_number))
 
 
-def parse_input(input_str: str) -> tuple[Dots, list[Fold]]:
+def parse_input(input_str: str) -> Paper:
     dots_str, folds_str = input_str.split("\n\n")
     dots = {
         (int(x), int(y)) for x, y in (line.split(",") for line in dots_str.split("\n"))
@@ -48,13 +51,10 @@ def fold_dot(dot: Dot, fold: Fold) -> Dot:
 
 def main():
 
-    lines = read_input()
-    dots, folds = parse_input(read_input())
+    paper = parse_input(read_input())
 
-    part_1 = do_part_1(dots, folds[0])
+    part_1, part_2 = solve(paper)
     print(f"{part_1=}")
-
-    part_2 = do_part_2(dots, folds)
     print(f"part_2=\n{part_2}")
 
 
@@ -78,9 +78,25 @@ def do_part_2(dots: Dots, folds: list[Fold]) -> str:
     )
 
 
-def read_input() -> str:
-    with open("day13.txt") as f:
-        return f.read()
+def solve_part_1(paper: Paper) -> int:
+    dots, folds = paper
+    return do_part_1(dots, folds[0])
+
+
+def solve_part_2(paper: Paper) -> str:
+    dots, folds = paper
+    return do_part_2(dots, folds)
+
+
+def solve(paper: Paper) -> Tuple[int, str]:
+    """Part 2 carries on folding from where part 1 stops."""
+    dots, folds = paper
+    dots = fold_paper(dots, folds[0])
+    return len(dots), do_part_2(dots, folds[1:])
+
+
+def read_input(filename: str = "day13.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,22 @@
 #!/usr/bin/env python
 from collections import Counter
-from functools import cache
+import sys
+from typing import Tuple
+
+import checkpoint
+import engines
+import loader
+import memo
+
+Instructions = Tuple[str, dict[str, str]]
 
 
 def main():
 
-    lines = read_input()
-    template = lines[0].strip()
-    rules = dict(line.strip().split(" -> ") for line in lines[2:])
+    instructions = parse_input(read_input())
 
-    part_1 = do_part_1(template, rules)
+    part_1, part_2 = solve(instructions)
     print(f"{part_1=}")
-
-    part_2 = do_part_2(template, rules)
-    part_2_not_recursive = do_part_2_not_recursive(template, rules)
-    assert part_2 == part_2_not_recursive
     print(f"{part_2=}")
 
 
@@ -48,7 +50,7 @@ def do_part_2(polymer, rules) -> int:
     totals: Counter = Counter(polymer[-1:])
 
     # Define inline so we have access to rules
-    @cache
+    @memo.memoize()
     def count(x, y, num):
         if num == 0:
             return Counter([x])
@@ -56,8 +58,9 @@ def do_part_2(polymer, rules) -> int:
             z = rules[x + y]
             return count(x, z, num - 1) + count(z, y, num - 1)
 
-    for x, y in zip(polymer, polymer[1:]):
-        totals += count(x, y, num_steps)
+    with memo.scoped(count):
+        for x, y in zip(polymer, polymer[1:]):
+            totals += count(x, y, num_steps)
 
     counts = totals.most_common()
     most = counts[0][1]
@@ -68,8 +71,26 @@ def do_part_2(polymer, rules) -> int:
 def do_part_2_not_recursive(polymer, rules) -> int:
     num_steps = 40
 
-    pairs = Counter(zip(polymer, polymer[1:]))
+    simulation = pairs_simulation(polymer, rules)
+    pairs = simulation.advance_to(num_steps)
+    return calc_pairs_difference(polymer, pairs)
+
 
+def pairs_simulation(polymer: str, rules: dict[str, str]) -> checkpoint.Simulation:
+    return checkpoint.Simulation(
+        "day14-pairs",
+        sys.modules[__name__],
+        (polymer, rules),
+        pairs_of(polymer),
+        lambda pairs: evolve_pairs(pairs, rules, 1),
+    )
+
+
+def pairs_of(polymer: str) -> Counter:
+    return Counter(zip(polymer, polymer[1:]))
+
+
+def evolve_pairs(pairs: Counter, rules: dict[str, str], num_steps: int) -> Counter:
     for i in range(num_steps):
         new_pairs: Counter = Counter()
         for (x, y), num in pairs.items():
@@ -77,7 +98,12 @@ def do_part_2_not_recursive(polymer, rules) -> int:
             new_pairs[(x, z)] += num
             new_pairs[(z, y)] += num
         pairs = new_pairs
+    return pairs
 
+
+def calc_pairs_difference(polymer: str, pairs: Counter) -> int:
+    # Every element is the first of a pair, apart from the last one, which
+    # never changes
     totals: Counter = Counter(polymer[-1:])
     for (x, y), num in pairs.items():
         totals[x] += num
@@ -88,9 +114,54 @@ def do_part_2_not_recursive(polymer, rules) -> int:
     return most - least
 
 
-def read_input() -> list[str]:
-    with open("day14.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> Instructions:
+    lines = input_str.splitlines()
+    template = lines[0].strip()
+    rules = dict(line.strip().split(" -> ") for line in lines[2:])
+    return template, rules
+
+
+@engines.register("part_1", engines.REFERENCE)
+def solve_part_1(instructions: Instructions) -> int:
+    template, rules = instructions
+    return do_part_1(template, rules)
+
+
+@engines.register("part_1", engines.OPTIMISED)
+def solve_part_1_pairs(instructions: Instructions) -> int:
+    template, rules = instructions
+    return calc_pairs_difference(template, evolve_pairs(pairs_of(template), rules, 10))
+
+
+@engines.register("part_2", engines.REFERENCE)
+def solve_part_2(instructions: Instructions) -> int:
+    template, rules = instructions
+    return do_part_2(template, rules)
+
+
+@engines.register("part_2", engines.OPTIMISED)
+def solve_part_2_pairs(instructions: Instructions) -> int:
+    template, rules = instructions
+    return do_part_2_not_recursive(template, rules)
+
+
+def solve(instructions: Instructions) -> Tuple[int, int]:
+    """
+    Count pairs rather than building the polymer, and carry on from step
+    10 to step 40 rather than starting again.
+    """
+    template, rules = instructions
+    simulation = pairs_simulation(template, rules)
+
+    pairs = simulation.advance_to(10)
+    part_1 = calc_pairs_difference(template, pairs)
+
+    pairs = simulation.advance_to(40)
+    return part_1, calc_pairs_difference(template, pairs)
+
+
+def read_input(filename: str = "day14.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
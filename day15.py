@@ -1,14 +1,20 @@
 #!/usr/bin/env python
-from collections import Counter
-from typing import Mapping, Tuple
+from array import array
+import sys
+from typing import Tuple
 
-Point = Tuple[int, int]
-Grid = Mapping[Point, int]
+import counters
+from grid import Grid
+import loader
+import parts
+
+INDEPENDENT_PARTS = True
 
 
 def make_grid(lines: list[list[int]], repeat=1) -> Grid:
-    num_lines = len(lines)
-    grid = {}
+    width = len(lines[0])
+    height = len(lines)
+    grid = Grid(width * repeat, height * repeat)
     for j, line in enumerate(lines):
         for i, x in enumerate(line):
             for x_repeat in range(repeat):
@@ -16,62 +22,72 @@ def make_grid(lines: list[list[int]], repeat=1) -> Grid:
                     val = x + x_repeat + y_repeat
                     if val > 9:
                         val -= 9
-                    grid[(i + num_lines * x_repeat, j + num_lines * y_repeat)] = val
-
-    return grid
-
+                    grid[grid.index(i + width * x_repeat, j + height * y_repeat)] = val
 
-def get_neighbours(point: Point) -> list[Point]:
-    x, y = point
-    return [
-        (x, y + 1),
-        (x + 1, y),
-        (x, y - 1),
-        (x - 1, y),
-    ]
+    # The border is never entered, see calc_minimum_risk
+    return grid.padded(1, 0)
 
 
 def main():
 
-    lines = read_input()
-    grid_1 = make_grid(lines)
-    part_1 = calc_minimum_risk(grid_1)
+    lines = parse_input(read_input())
+    part_1, part_2 = parts.solve(sys.modules[__name__], lines)
     print(f"{part_1=}")
-
-    grid_2 = make_grid(lines, repeat=5)
-    part_2 = calc_minimum_risk(grid_2)
     print(f"{part_2=}")
 
 
 def calc_minimum_risk(grid: Grid) -> int:
-    minimum_costs = {
-        (0, 0): 0,
-    }
+    risks = grid.cells
+    offsets = grid.neighbour_offsets()
+    start = grid.index(1, 1)
+    end = grid.index(grid.width - 2, grid.height - 2)
+
+    # -1 for points we haven't reached yet, and 0 for the border, which
+    # nothing is ever cheaper than
+    minimum_costs = array("q", [0]) * len(grid)
+    for point in grid.interior():
+        minimum_costs[point] = -1
+    minimum_costs[start] = 0
 
-    todo = {(0, 0)}
+    todo = {start}
+    pops = 0
 
     while todo:
         point = todo.pop()
+        pops += 1
         cost = minimum_costs[point]
 
-        for neighbour in get_neighbours(point):
+        for offset in offsets:
+            neighbour = point + offset
+            new_cost = cost + risks[neighbour]
+            if minimum_costs[neighbour] < 0 or new_cost < minimum_costs[neighbour]:
+                minimum_costs[neighbour] = new_cost
+                todo.add(neighbour)
 
-            risk = grid.get(neighbour)
-            if risk is None:
-                continue
+    counters.add("queue_pops", pops)
+    return minimum_costs[end]
+
+
+def parse_input(input_str: str) -> list[list[int]]:
+    return [[int(x) for x in line.strip()] for line in input_str.splitlines()]
+
+
+def solve_part_1(lines: list[list[int]]) -> int:
+    grid_1 = make_grid(lines)
+    return calc_minimum_risk(grid_1)
+
+
+def solve_part_2(lines: list[list[int]]) -> int:
+    grid_2 = make_grid(lines, repeat=5)
+    return calc_minimum_risk(grid_2)
 
-            if neighbour not in minimum_costs or cost + risk < minimum_costs[neighbour]:
-                minimum_costs[neighbour] = cost + risk
-                todo.add(neighbour)
 
-    max_x = max([x for x, y in grid])
-    max_y = max_x  # specified in question
-    return minimum_costs[(max_x, max_y)]
+def solve(lines: list[list[int]]) -> Tuple[int, int]:
+    return solve_part_1(lines), solve_part_2(lines)
 
 
-def read_input() -> list[list[int]]:
-    with open("day15.txt") as f:
-        return [[int(x) for x in line.strip()] for line in f.readlines()]
+def read_input(filename: str = "day15.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 from dataclasses import dataclass, field
 import math
-from typing import Tuple
+from typing import Tuple, Union
+
+import engines
+import loader
 
 
 def hex_string_to_bits(hex_string: str) -> str:
@@ -94,21 +97,98 @@ def decode_packet(remainder: str) -> Tuple[Packet, str]:
             )
 
 
+class BitReader:
+    """
+    Reads bits straight out of a string or buffer of hex digits, without
+    expanding the whole transmission into a string of bits first.
+    """
+
+    def __init__(self, hex_digits: Union[str, bytes, memoryview]):
+        self.hex_digits = hex_digits
+        self.position = 0
+
+    def read(self, num_bits: int) -> int:
+        start, end = self.position, self.position + num_bits
+        first_digit, last_digit = start // 4, (end + 3) // 4
+        digits = self.hex_digits[first_digit:last_digit]
+        if isinstance(digits, memoryview):
+            digits = bytes(digits)
+        value = int(digits, 16) >> (4 * last_digit - end)
+        self.position = end
+        return value & ((1 << num_bits) - 1)
+
+
+def read_packet(bits: BitReader) -> Packet:
+    packet_version = bits.read(3)
+    packet_type = bits.read(3)
+
+    if packet_type == 4:
+        # literal value
+        literal_value = 0
+        continue_bit = 1
+        while continue_bit:
+            continue_bit = bits.read(1)
+            literal_value = literal_value << 4 | bits.read(4)
+        return Packet(packet_version, packet_type, literal_value)
+
+    # operator packet
+    sub_packets = []
+    length_type_id = bits.read(1)
+    if length_type_id == 0:
+        total_length = bits.read(15)
+        end = bits.position + total_length
+        while bits.position < end:
+            sub_packets.append(read_packet(bits))
+    else:
+        num_packets = bits.read(11)
+        for x in range(num_packets):
+            sub_packets.append(read_packet(bits))
+
+    return Packet(packet_version, packet_type, sub_packets=sub_packets)
+
+
 def main():
-    hex_string = read_input()
-    bit_string = hex_string_to_bits(hex_string)
-    packet, _ = decode_packet(bit_string)
+    packet = parse_file()
 
-    part_1 = packet.sum_version_numbers()
+    part_1, part_2 = solve(packet)
     print(f"{part_1=}")
-
-    part_2 = packet.evaluate()
     print(f"{part_2=}")
 
 
-def read_input() -> str:
-    with open("day16.txt") as f:
-        return f.read().strip()
+@engines.register("parse", engines.OPTIMISED)
+def parse_input(input_str: str) -> Packet:
+    return read_packet(BitReader(input_str.strip()))
+
+
+@engines.register("parse", engines.REFERENCE)
+def parse_input_bits(input_str: str) -> Packet:
+    packet, remainder = decode_packet(hex_string_to_bits(input_str.strip()))
+    return packet
+
+
+def parse_bytes(data: Union[bytes, memoryview]) -> Packet:
+    return read_packet(BitReader(data))
+
+
+def parse_file(filename: str = "day16.txt") -> Packet:
+    with loader.open_bytes(filename) as data:
+        return parse_bytes(data)
+
+
+def solve_part_1(packet: Packet) -> int:
+    return packet.sum_version_numbers()
+
+
+def solve_part_2(packet: Packet) -> int:
+    return packet.evaluate()
+
+
+def solve(packet: Packet) -> Tuple[int, int]:
+    return solve_part_1(packet), solve_part_2(packet)
+
+
+def read_input(filename: str = "day16.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
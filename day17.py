@@ -4,6 +4,8 @@ import math
 import re
 from typing import Tuple
 
+import loader
+
 
 def parse_line(line):
     return [
@@ -38,13 +40,10 @@ def test(target: Target, v_x: int, v_y: int) -> Tuple[bool, int]:
 
 
 def main():
-    line = read_input()
-    target = Target(*parse_line(line))
+    target = parse_input(read_input())
 
-    part_1 = do_part_1(target, debug=True)
+    part_1, part_2 = solve(target)
     print(f"{part_1=}")
-
-    part_2 = do_part_2(target)
     print(f"{part_2=}")
 
 
@@ -83,9 +82,24 @@ def do_part_2(target: Target) -> int:
     return count
 
 
-def read_input() -> str:
-    with open("day17.txt") as f:
-        return f.read().strip()
+def parse_input(input_str: str) -> Target:
+    return Target(*parse_line(input_str.strip()))
+
+
+def solve_part_1(target: Target) -> int:
+    return do_part_1(target)
+
+
+def solve_part_2(target: Target) -> int:
+    return do_part_2(target)
+
+
+def solve(target: Target) -> Tuple[int, int]:
+    return solve_part_1(target), solve_part_2(target)
+
+
+def read_input(filename: str = "day17.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ from typing import Generator, Tuple
 from functools import reduce
 from itertools import permutations
 
+import loader
+
 
 class Node:
     def __init__(self, left=None, right=None, value=None):
@@ -122,19 +124,31 @@ def do_part_2(nodes: list[Node]) -> int:
 
 
 def main():
-    lines = read_input()
+    nodes = parse_input(read_input())
 
-    nodes = parse_lines(lines)
-    part_1 = do_part_1(nodes)
+    part_1, part_2 = solve(nodes)
     print(f"{part_1=}")
-
-    part_2 = do_part_2(nodes)
     print(f"{part_2=}")
 
 
-def read_input() -> list[str]:
-    with open("day18.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> list[Node]:
+    return parse_lines(input_str.splitlines())
+
+
+def solve_part_1(nodes: list[Node]) -> int:
+    return do_part_1(nodes)
+
+
+def solve_part_2(nodes: list[Node]) -> int:
+    return do_part_2(nodes)
+
+
+def solve(nodes: list[Node]) -> Tuple[int, int]:
+    return solve_part_1(nodes), solve_part_2(nodes)
+
+
+def read_input(filename: str = "day18.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
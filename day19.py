@@ -4,6 +4,9 @@ from functools import reduce
 import itertools
 from typing import Optional, Tuple
 
+import counters
+import loader
+
 Beacon = Tuple[int, int, int]
 ScannerPosition = Tuple[int, int, int]
 
@@ -62,23 +65,32 @@ def compare_beacons(
     Apply transformations to the relative beacons, and if we manage to
     find a suitable transformation, return the matched Scanner instance.
     """
-    for t in transforms:
-        transformed_points = {t(x1, x2, x3) for (x1, x2, x3) in relative_beacons}
-
-        for x0, y0, z0 in absolute_beacons:
-            for xt, yt, zt in transformed_points:
-                # translation vector
-                (x, y, z) = (x0 - xt, y0 - yt, z0 - zt)
-                translated_points = {
-                    (x + t1, y + t2, z + t3) for t1, t2, t3 in transformed_points
-                }
-                if len(translated_points & absolute_beacons) >= 12:
-                    return Scanner(
-                        relative_beacons,
-                        translated_points,
-                        (x, y, z),
-                    )
-    return None
+    transform_trials = 0
+    translation_trials = 0
+
+    try:
+        for t in transforms:
+            transform_trials += 1
+            transformed_points = {t(x1, x2, x3) for (x1, x2, x3) in relative_beacons}
+
+            for x0, y0, z0 in absolute_beacons:
+                for xt, yt, zt in transformed_points:
+                    translation_trials += 1
+                    # translation vector
+                    (x, y, z) = (x0 - xt, y0 - yt, z0 - zt)
+                    translated_points = {
+                        (x + t1, y + t2, z + t3) for t1, t2, t3 in transformed_points
+                    }
+                    if len(translated_points & absolute_beacons) >= 12:
+                        return Scanner(
+                            relative_beacons,
+                            translated_points,
+                            (x, y, z),
+                        )
+        return None
+    finally:
+        counters.add("transform_trials", transform_trials)
+        counters.add("translation_trials", translation_trials)
 
 
 def assemble_scanners(
@@ -130,20 +142,33 @@ def do_part_2(scanners: list[Scanner]) -> int:
 
 
 def main():
-    beacons_dict = {i: parse_scanner(x) for i, x in enumerate(read_input())}
-
-    scanners = assemble_scanners(beacons_dict)
+    beacons_dict = parse_input(read_input())
 
-    part_1 = do_part_1(scanners)
+    part_1, part_2 = solve(beacons_dict)
     print(f"{part_1=}")
+    print(f"{part_2=}")
 
-    part_1 = do_part_2(scanners)
-    print(f"{part_1=}")
+
+def parse_input(input_str: str) -> dict[int, set[Beacon]]:
+    return {i: parse_scanner(x) for i, x in enumerate(input_str.split("\n\n"))}
+
+
+def solve_part_1(beacons_dict: dict[int, set[Beacon]]) -> int:
+    # assemble_scanners pops from the dict, so give it a copy
+    return do_part_1(assemble_scanners(dict(beacons_dict)))
+
+
+def solve_part_2(beacons_dict: dict[int, set[Beacon]]) -> int:
+    return do_part_2(assemble_scanners(dict(beacons_dict)))
+
+
+def solve(beacons_dict: dict[int, set[Beacon]]) -> Tuple[int, int]:
+    scanners = assemble_scanners(dict(beacons_dict))
+    return do_part_1(scanners), do_part_2(scanners)
 
 
-def read_input() -> list[str]:
-    with open("day19.txt") as f:
-        return f.read().split("\n\n")
+def read_input(filename: str = "day19.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
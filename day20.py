@@ -1,84 +1,112 @@
 #!/usr/bin/env python
-from typing import Mapping, Tuple
-
-Point = Tuple[int, int]
-Points = Mapping[Point, str]
-
-
-def parse_input(input_string: str) -> Tuple[str, Points]:
-    algorithm, grid_string = input_string.split("\n\n")
-
-    points = {}
-    for j, line in enumerate(grid_string.split("\n")):
-        for i, val in enumerate(line):
-            points[(i, j)] = val
-
-    return algorithm, points
-
-
-def get_pixels(x: int, y: int) -> list[Point]:
-    return [
-        (x - 1, y - 1),
-        (x + 0, y - 1),
-        (x + 1, y - 1),
-        (x - 1, y + 0),
-        (x + 0, y + 0),
-        (x + 1, y + 0),
-        (x - 1, y + 1),
-        (x + 0, y + 1),
-        (x + 1, y + 1),
-    ]
-
-
-def enhance(points: Points, algorithm: str, default: str) -> Tuple[Points, str]:
-    new_points = {}
-    min_x = min(x for x, y in points.keys())
-    max_x = max(x for x, y in points.keys())
-    min_y = min(y for x, y in points.keys())
-    max_y = max(y for x, y in points.keys())
-
-    for x in range(min_x - 1, max_x + 2):
-        for y in range(min_y - 1, max_y + 2):
-            pixels = get_pixels(x, y)
-            pixel_values = [points.get(p, default) for p in pixels]
-            binary_number = int(
-                "".join("1" if p == "#" else "0" for p in pixel_values), 2
+from array import array
+import sys
+from typing import Tuple
+
+import checkpoint
+from grid import Grid
+import loader
+import parts
+
+INDEPENDENT_PARTS = True
+
+Image = Tuple[str, Grid]
+
+PIXELS = ".#"
+
+
+def parse_input(input_string: str) -> Image:
+    algorithm, grid_string = input_string.strip().split("\n\n")
+    return algorithm, Grid.from_lines(grid_string.split("\n"), PIXELS.index)
+
+
+def enhance(grid: Grid, algorithm: str, default: int) -> Tuple[Grid, int]:
+    """
+    The image grows by one pixel on every side each time it's enhanced,
+    and every pixel outside of it has the default value.
+    """
+    lookup = [PIXELS.index(p) for p in algorithm]
+
+    # Pad by two so that the 3x3 square around every pixel of the new,
+    # larger image is inside the padded one
+    padded = grid.padded(2, default)
+    pixels = padded.cells
+    padded_width = padded.width
+
+    width, height = grid.width + 2, grid.height + 2
+    new_pixels = array(pixels.typecode, [0]) * (width * height)
+
+    for y in range(height):
+        top = y * padded_width
+        middle = top + padded_width
+        bottom = middle + padded_width
+        for x in range(width):
+            binary_number = (
+                pixels[top + x] << 8
+                | pixels[top + x + 1] << 7
+                | pixels[top + x + 2] << 6
+                | pixels[middle + x] << 5
+                | pixels[middle + x + 1] << 4
+                | pixels[middle + x + 2] << 3
+                | pixels[bottom + x] << 2
+                | pixels[bottom + x + 1] << 1
+                | pixels[bottom + x + 2]
             )
-            new_value = algorithm[binary_number]
-            new_points[(x, y)] = new_value
+            new_pixels[y * width + x] = lookup[binary_number]
 
-    default_pixel_values = [default] * 9
-    binary_number = int(
-        "".join("1" if p == "#" else "0" for p in default_pixel_values), 2
-    )
-    default = algorithm[binary_number]
+    default = lookup[0b111111111 if default else 0]
+
+    return Grid(width, height, new_pixels), default
 
-    return new_points, default
 
+def enhance_simulation(grid: Grid, algorithm: str) -> checkpoint.Simulation:
+    # The state is the image and the value of every pixel outside of it
+    return checkpoint.Simulation(
+        "day20-enhance",
+        sys.modules[__name__],
+        (grid, algorithm),
+        (grid, 0),
+        lambda state: enhance(state[0], algorithm, state[1]),
+    )
 
-def repeated_enhance(points: Points, algorithm: str, num_times: int) -> int:
-    default = "."
-    for x in range(num_times):
-        points, default = enhance(points, algorithm, default)
 
-    return len([v for v in points.values() if v == "#"])
+def repeated_enhance(grid: Grid, algorithm: str, num_times: int) -> int:
+    grid, default = enhance_simulation(grid, algorithm).advance_to(num_times)
+    return grid.cells.count(1)
 
 
 def main():
-    algorithm, points = parse_input(read_input())
-    # To start with, every other point is off
-    default = "."
+    image = parse_input(read_input())
 
-    part_1 = repeated_enhance(points, algorithm, 2)
+    part_1, part_2 = parts.solve(sys.modules[__name__], image)
     print(f"{part_1=}")
-
-    part_2 = repeated_enhance(points, algorithm, 50)
     print(f"{part_2=}")
 
 
-def read_input() -> str:
-    with open("day20.txt") as f:
-        return f.read().strip()
+def solve_part_1(image: Image) -> int:
+    algorithm, grid = image
+    return repeated_enhance(grid, algorithm, 2)
+
+
+def solve_part_2(image: Image) -> int:
+    algorithm, grid = image
+    return repeated_enhance(grid, algorithm, 50)
+
+
+def solve(image: Image) -> Tuple[int, int]:
+    """Part 2 carries on enhancing from where part 1 stops."""
+    algorithm, grid = image
+    simulation = enhance_simulation(grid, algorithm)
+
+    grid, default = simulation.advance_to(2)
+    part_1 = grid.cells.count(1)
+
+    grid, default = simulation.advance_to(50)
+    return part_1, grid.cells.count(1)
+
+
+def read_input(filename: str = "day20.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
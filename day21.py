@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from itertools import cycle, product
 from typing import Mapping, Iterator, Tuple
 
+import loader
+
 
 @dataclass
 class Universe:
@@ -25,14 +27,10 @@ def calc_distribution(values: list[int], num_rolls: int) -> Mapping[int, int]:
 
 
 def main():
-    lines = read_input()
-    starting_pos_1 = int(lines[0].strip().rsplit(" ", 1)[1])
-    starting_pos_2 = int(lines[1].strip().rsplit(" ", 1)[1])
+    starting_positions = parse_input(read_input())
 
-    part_1 = do_part_1(starting_pos_1, starting_pos_2)
+    part_1, part_2 = solve(starting_positions)
     print(f"{part_1=}")
-
-    part_2 = do_part_2(starting_pos_1, starting_pos_2)
     print(f"{part_2=}")
 
 
@@ -106,9 +104,27 @@ def do_part_2(starting_pos_1: int, starting_pos_2: int) -> int:
     return max(winning_universes)
 
 
-def read_input() -> list[str]:
-    with open("day21.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> Tuple[int, int]:
+    lines = input_str.splitlines()
+    starting_pos_1 = int(lines[0].strip().rsplit(" ", 1)[1])
+    starting_pos_2 = int(lines[1].strip().rsplit(" ", 1)[1])
+    return starting_pos_1, starting_pos_2
+
+
+def solve_part_1(starting_positions: Tuple[int, int]) -> int:
+    return do_part_1(*starting_positions)
+
+
+def solve_part_2(starting_positions: Tuple[int, int]) -> int:
+    return do_part_2(*starting_positions)
+
+
+def solve(starting_positions: Tuple[int, int]) -> Tuple[int, int]:
+    return solve_part_1(starting_positions), solve_part_2(starting_positions)
+
+
+def read_input(filename: str = "day21.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,9 @@
 from dataclasses import dataclass
 import itertools
 import re
+from typing import Tuple
+
+import loader
 
 
 @dataclass
@@ -34,14 +37,10 @@ def parse_line(line: str) -> Cuboid:
 
 
 def main():
-    lines = read_input()
-
-    cuboids = [parse_line(line) for line in lines]
+    cuboids = parse_input(read_input())
 
-    part_1 = do_part_1(cuboids)
+    part_1, part_2 = solve(cuboids)
     print(f"{part_1=}")
-
-    part_2 = do_part_2(cuboids)
     print(f"{part_2=}")
 
 
@@ -161,9 +160,24 @@ def do_part_2(cuboids: list[Cuboid]) -> int:
     return total
 
 
-def read_input() -> list[str]:
-    with open("day22.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> list[Cuboid]:
+    return [parse_line(line) for line in input_str.splitlines()]
+
+
+def solve_part_1(cuboids: list[Cuboid]) -> int:
+    return do_part_1(cuboids)
+
+
+def solve_part_2(cuboids: list[Cuboid]) -> int:
+    return do_part_2(cuboids)
+
+
+def solve(cuboids: list[Cuboid]) -> Tuple[int, int]:
+    return solve_part_1(cuboids), solve_part_2(cuboids)
+
+
+def read_input(filename: str = "day22.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
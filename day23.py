@@ -1,9 +1,16 @@
 #!/usr/bin/env python
 from collections import Counter
 from dataclasses import dataclass
-import functools
+import sys
 from typing import Generator, NewType, Optional, Tuple
 
+import counters
+import loader
+import memo
+import parts
+
+INDEPENDENT_PARTS = True
+
 
 Amphipod = NewType("Amphipod", str)
 
@@ -196,13 +203,14 @@ class State:
         return sum(counts[amphipod] * energy_costs[amphipod] for amphipod in amphipods)
 
 
-@functools.cache
+@memo.memoize()
 def find_least_possible_energy(
-    queues: Queue, top_row: Tuple[str, str]
+    queues: Queues, top_row: Tuple[Tuple[str, str], ...]
 ) -> Optional[int]:
     """
     Find the least possible energy, excluding fixed costs
     """
+    counters.add("states_expanded")
     state = State(queues, top_row, 0)
     if state.is_complete():
         return 0
@@ -230,31 +238,46 @@ def find_least_possible_total_energy(queues: Queues) -> int:
     Find the least possible energy, including fixed costs
     """
     s = State(queues)
-    search = find_least_possible_energy(queues, ())
+    # The states of one burrow are no use for another, so don't keep them
+    with memo.scoped(find_least_possible_energy):
+        search = find_least_possible_energy(queues, ())
     if search is None:
         raise ValueError("Couldn't solve input")
     return search + s.fixed_cost()
 
 
 def main():
-    lines = read_input()
+    lines = parse_input(read_input())
 
-    queues_1 = parse_input_queues(lines)
-    part_1 = find_least_possible_total_energy(queues_1)
+    part_1, part_2 = parts.solve(sys.modules[__name__], lines)
     print(f"{part_1=}")
+    print(f"{part_2=}")
+
+
+def parse_input(input_str: str) -> list[str]:
+    return input_str.splitlines()
+
 
+def solve_part_1(lines: list[str]) -> int:
+    queues_1 = parse_input_queues(lines)
+    return find_least_possible_total_energy(queues_1)
+
+
+def solve_part_2(lines: list[str]) -> int:
     extra_lines = [
         "#D#C#B#A#",
         "#D#B#A#C#",
     ]
     queues_2 = parse_input_queues(lines, extra_lines=extra_lines)
-    part_2 = find_least_possible_total_energy(queues_2)
-    print(f"{part_2=}")
+    return find_least_possible_total_energy(queues_2)
+
+
+def solve(lines: list[str]) -> Tuple[int, int]:
+    return solve_part_1(lines), solve_part_2(lines)
 
 
-def read_input() -> list[str]:
-    with open("day23.txt") as f:
-        return f.readlines()
+def read_input(filename: str = "day23.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
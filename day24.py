@@ -2,6 +2,9 @@
 from functools import partial
 from typing import Literal, Tuple, TypedDict
 
+import counters
+import loader
+
 Key = Literal["w", "x", "y", "z"]
 Commands = list[partial]
 # map a score z to the lowest and highest digits that generate it
@@ -118,6 +121,7 @@ def find_numbers(commands: list[Commands]) -> Tuple[int, int]:
                 else:
                     turns[variables["z"]][1] = highest + (w,)
 
+        counters.add(f"z_states_digit_{i + 1:02}", len(turns))
         previous_turns = turns
 
     lowest, highest = turns[0]  # type: ignore
@@ -125,20 +129,37 @@ def find_numbers(commands: list[Commands]) -> Tuple[int, int]:
 
 
 def main():
-    lines = read_input()
-
-    grouped_lines = [lines[x + 0 : x + 18] for x in range(0, len(lines), 18)]
-    commands = [process_commands(g) for g in grouped_lines]
+    commands = parse_input(read_input())
 
-    part_b, part_a = find_numbers(commands)
+    part_a, part_b = solve(commands)
 
     print(f"{part_a=}")
     print(f"{part_b=}")
 
 
-def read_input() -> list[str]:
-    with open("day24.txt") as f:
-        return f.readlines()
+def parse_input(input_str: str) -> list[Commands]:
+    lines = input_str.splitlines()
+    grouped_lines = [lines[x + 0 : x + 18] for x in range(0, len(lines), 18)]
+    return [process_commands(g) for g in grouped_lines]
+
+
+def solve_part_1(commands: list[Commands]) -> int:
+    lowest, highest = find_numbers(commands)
+    return highest
+
+
+def solve_part_2(commands: list[Commands]) -> int:
+    lowest, highest = find_numbers(commands)
+    return lowest
+
+
+def solve(commands: list[Commands]) -> Tuple[int, int]:
+    lowest, highest = find_numbers(commands)
+    return highest, lowest
+
+
+def read_input(filename: str = "day24.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
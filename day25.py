@@ -1,69 +1,70 @@
 #!/usr/bin/env python
 from dataclasses import dataclass
-from typing import Mapping, Tuple, Literal
+import sys
+from typing import Literal, Tuple
 
-Point = Tuple[int, int]
+import checkpoint
+from grid import DOWN, RIGHT, Grid
+import loader
+
+SYMBOLS = ".>v"
+EMPTY, EAST, SOUTH = range(3)
 
 
 @dataclass
 class Turn:
-    easts: set[Point]
-    souths: set[Point]
-    width: int
-    height: int
+    grid: Grid
     count: int = 0
 
+    @property
+    def width(self) -> int:
+        return self.grid.width
+
+    @property
+    def height(self) -> int:
+        return self.grid.height
+
     def __eq__(self, other) -> bool:
-        return (
-            isinstance(other, Turn)
-            and self.easts == other.easts
-            and self.souths == other.souths
-        )
+        return isinstance(other, Turn) and self.grid == other.grid
 
     def next_turn(self) -> "Turn":
-        occupied = self.easts | self.souths
-        new_easts = {
-            ((x + 1) % self.width, y)
-            if ((x + 1) % self.width, y) not in occupied
-            else (x, y)
-            for (x, y) in self.easts
-        }
-        occupied = new_easts | self.souths
-        new_souths = {
-            (x, (y + 1) % self.height)
-            if (x, (y + 1) % self.height) not in occupied
-            else (x, y)
-            for (x, y) in self.souths
-        }
-
-        return Turn(new_easts, new_souths, self.width, self.height, self.count + 1)
+        new_grid = self.move(self.grid, EAST, RIGHT)
+        new_grid = self.move(new_grid, SOUTH, DOWN)
+        return Turn(new_grid, self.count + 1)
+
+    @staticmethod
+    def move(grid: Grid, herd: int, direction: int) -> Grid:
+        """
+        Every member of the herd moves at once, if the space ahead is empty.
+        The sea floor wraps around at the edges.
+        """
+        cells = grid.cells
+        new_cells = cells[:]
+        width, size = grid.width, len(cells)
+        offset = grid.neighbour_offsets()[direction]
+        for point, val in enumerate(cells):
+            if val == herd:
+                ahead = point + offset
+                # Herds only move right or down, off the end of a row or
+                # the bottom of the grid
+                if direction == RIGHT and ahead % width == 0:
+                    ahead -= width
+                elif ahead >= size:
+                    ahead -= size
+                if cells[ahead] == EMPTY:
+                    new_cells[ahead] = herd
+                    new_cells[point] = EMPTY
+        return grid.copy(new_cells)
 
     def get_val(self, i: int, j: int) -> Literal[">", "v", "."]:
-        if (i, j) in self.easts:
-            return ">"
-        elif (i, j) in self.souths:
-            return "v"
-        else:
-            return "."
+        return SYMBOLS[self.grid[self.grid.index(i, j)]]  # type: ignore
 
     def as_string(self) -> str:
-        return "\n".join(
-            "".join(self.get_val(i, j) for i in range(self.width))
-            for j in range(self.height)
-        )
+        return self.grid.as_string(SYMBOLS)
 
     @classmethod
     def from_lines(cls, lines: list[str]) -> "Turn":
-        easts = set()
-        souths = set()
-        for j, line in enumerate(lines):
-            for i, val in enumerate(line.strip()):
-                if val == ">":
-                    easts.add((i, j))
-                elif val == "v":
-                    souths.add((i, j))
-
-        return cls(easts, souths, len(lines[0].strip()), len(lines), 0)
+        return cls(Grid.from_lines(lines, SYMBOLS.index), 0)
 
 
 def do_part_b() -> None:
@@ -72,27 +73,59 @@ def do_part_b() -> None:
 
 
 def main():
-    lines = read_input()
+    lines = parse_input(read_input())
 
-    part_a = do_part_a(lines)
+    part_a = solve_part_1(lines)
     print(f"{part_a=}")
 
     do_part_b()
 
 
-def do_part_a(lines) -> int:
-    previous_turn = None
+# The state is the grid, the number of turns and whether anything moved
+# on the last one. A Turn isn't used, as it pickles differently when this
+# is run as a script, and so couldn't be shared with the runner's runs
+State = Tuple[Grid, int, bool]
+
+
+def step(state: State) -> State:
+    grid, count, _ = state
+    next_turn = Turn(grid, count).next_turn()
+    return next_turn.grid, next_turn.count, next_turn.grid != grid
+
+
+def do_part_a(lines: list[str]) -> int:
     turn = Turn.from_lines(lines)
 
-    while previous_turn != turn:
-        previous_turn, turn = turn, turn.next_turn()
+    simulation = checkpoint.Simulation(
+        "day25-settle",
+        sys.modules[__name__],
+        lines,
+        (turn.grid, turn.count, True),
+        step,
+    )
+    _, count, _ = simulation.advance_until(lambda state: not state[2])
+
+    return count
+
+
+def parse_input(input_str: str) -> list[str]:
+    return input_str.splitlines()
+
+
+def solve_part_1(lines: list[str]) -> int:
+    return do_part_a(lines)
+
+
+def solve_part_2(lines: list[str]) -> None:
+    return do_part_b()
+
 
-    return turn.count
+def solve(lines: list[str]) -> Tuple[int, None]:
+    return solve_part_1(lines), None
 
 
-def read_input() -> list[str]:
-    with open("day25.txt") as f:
-        return f.readlines()
+def read_input(filename: str = "day25.txt") -> str:
+    return loader.read_text(filename)
 
 
 if __name__ == "__main__":
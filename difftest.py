@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Differential testing of the engines registered for each day.
+
+Every engine of every stage is run on the same generated inputs and
+its answer is compared with the reference engine's (or, if there isn't
+one, the slowest engine's), see engines.py. Exits with status 1 if any
+engine disagrees or fails.
+
+    ./difftest.py                          # every day with several engines
+    ./difftest.py 14 16 --sizes 10 100 --seeds 5
+"""
+import argparse
+from dataclasses import dataclass
+import sys
+from typing import Any, Iterable, Optional
+
+from bench import DEFAULT_SIZES
+import engines
+from generators import generate
+from runner import NUM_DAYS, load_day
+
+
+@dataclass
+class Difference:
+    day: int
+    stage: str
+    size: int
+    seed: int
+    engine: str
+    expected: Any
+    answer: Any
+
+
+def check_day(day: int, sizes: Iterable[int], seeds: int = 1) -> list[Difference]:
+    module = load_day(day)
+    differences = []
+    for stage in engines.STAGES:
+        stage_engines = engines.registered(module, stage)
+        if len(stage_engines) < 2:
+            continue
+        for size in sizes:
+            for seed in range(seeds):
+                input_str = generate(day, size, seed)
+                answers = {}
+                for name, engine in stage_engines.items():
+                    if stage == "parse":
+                        argument = input_str
+                    else:
+                        # Parse afresh for every engine, as some solutions
+                        # modify their input
+                        argument = module.parse_input(input_str)
+                    try:
+                        answers[name] = engine.function(argument)
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                        differences.append(
+                            Difference(day, stage, size, seed, name, None, error)
+                        )
+                if not answers:
+                    continue
+
+                expected_name, *other_names = answers
+                expected = answers[expected_name]
+                differences.extend(
+                    Difference(day, stage, size, seed, name, expected, answers[name])
+                    for name in other_names
+                    if answers[name] != expected
+                )
+    return differences
+
+
+def days_with_engines() -> list[int]:
+    return [
+        day
+        for day in range(1, NUM_DAYS + 1)
+        if any(
+            len(engines.registered(load_day(day), stage)) > 1
+            for stage in engines.STAGES
+        )
+    ]
+
+
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        help="days to test (default: every day with several engines)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="input sizes (default: the two smallest benchmark sizes)",
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=3, help="number of inputs of each size"
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+
+    failed = False
+    for day in args.days or days_with_engines():
+        sizes = args.sizes or DEFAULT_SIZES[day][:2]
+        differences = check_day(day, sizes, args.seeds)
+        print(f"day{day:02}: {len(differences) or 'no'} differences")
+        for d in differences:
+            failed = True
+            print(
+                f"  {d.stage} size={d.size} seed={d.seed}: "
+                f"{d.engine} gave {d.answer!r}, expected {d.expected!r}"
+            )
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
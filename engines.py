@@ -0,0 +1,106 @@
+"""
+Several implementations, or engines, of the same stage of a solution.
+
+A day can register more than one function for a stage ("parse",
+"part_1" or "part_2"), each taking the same argument and giving the
+same answer, from the plain reference version to optimised and
+vectorised ones:
+
+    @engines.register("part_2", engines.REFERENCE)
+    def solve_part_2(instructions): ...
+
+    @engines.register("part_2", engines.OPTIMISED)
+    def solve_part_2_pairs(instructions): ...
+
+The runner uses the fastest engine that is available, unless another is
+asked for with --engine or the AOC_ENGINE environment variable. Days
+that register nothing for a stage use their parse_input or
+solve_part_N as usual.
+
+Engines aren't checked against each other while solving. difftest.py
+runs every engine on generated inputs and compares their answers.
+"""
+from dataclasses import dataclass
+import os
+from types import ModuleType
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ENV_VAR = "AOC_ENGINE"
+
+REFERENCE = "reference"
+OPTIMISED = "optimised"
+VECTORISED = "vectorised"
+
+# From slowest to fastest
+KINDS = (REFERENCE, OPTIMISED, VECTORISED)
+
+STAGES = ("parse", "part_1", "part_2")
+
+
+@dataclass
+class Engine:
+    name: str
+    function: Callable
+    available: bool = True
+
+
+# Engines by module name and stage, in the order they were registered
+_registry: dict[str, dict[str, dict[str, Engine]]] = {}
+
+
+def register(
+    stage: str, name: str = REFERENCE, available: bool = True
+) -> Callable[[F], F]:
+    """
+    Register a function as the engine called name for stage of the day
+    it's defined in. Engines that need an optional dependency which
+    isn't installed can be registered with available=False.
+    """
+    if stage not in STAGES:
+        raise ValueError(f"Unknown stage {stage!r}")
+    if name not in KINDS:
+        raise ValueError(f"Unknown engine {name!r}")
+
+    def decorator(func: F) -> F:
+        stages = _registry.setdefault(func.__module__, {})
+        stages.setdefault(stage, {})[name] = Engine(name, func, available)
+        return func
+
+    return decorator
+
+
+def default(module: ModuleType, stage: str) -> Callable:
+    if stage == "parse":
+        return module.parse_input
+    return getattr(module, f"solve_{stage}")
+
+
+def registered(module: ModuleType, stage: str) -> dict[str, Engine]:
+    """The available engines for a stage, from slowest to fastest."""
+    engines = _registry.get(module.__name__, {}).get(stage, {})
+    return {
+        name: engines[name]
+        for name in KINDS
+        if name in engines and engines[name].available
+    }
+
+
+def default_name() -> Optional[str]:
+    return os.environ.get(ENV_VAR) or None
+
+
+def select(module: ModuleType, stage: str, name: Optional[str] = None) -> Callable:
+    """
+    The engine called name (by default, $AOC_ENGINE) for stage, or the
+    fastest one if there is no such engine.
+    """
+    engines = registered(module, stage)
+    if not engines:
+        return default(module, stage)
+    if name is None:
+        name = default_name()
+    if name in engines:
+        return engines[name].function
+    return list(engines.values())[-1].function
@@ -0,0 +1,563 @@
+#!/usr/bin/env python
+"""
+Deterministic generators for synthetic puzzle inputs.
+
+Each generator takes a size knob and a seeded Random instance and
+returns the contents of an input file for that day, in the same format
+as the real puzzle input. The meaning of size depends on the day, see
+SIZE_KNOBS.
+
+    ./generators.py 15 100 > day15.txt   # 100x100 grid for day 15
+"""
+import argparse
+import itertools
+import random
+import string
+from typing import Callable, Optional, Tuple
+
+Generator = Callable[[int, random.Random], str]
+
+SIZE_KNOBS = {
+    1: "number of depths",
+    2: "number of commands",
+    3: "number of report lines",
+    4: "number of bingo cards",
+    5: "number of vent lines",
+    6: "number of fish",
+    7: "number of crabs",
+    8: "number of display lines",
+    9: "grid side",
+    10: "number of lines",
+    11: "grid side",
+    12: "number of small caves",
+    13: "number of dots",
+    14: "template length",
+    15: "grid side",
+    16: "number of packets",
+    17: "target width",
+    18: "number of snailfish numbers",
+    19: "number of scanners",
+    20: "image side",
+    21: "ignored",
+    22: "number of cuboids",
+    23: "ignored",
+    24: "maximum nesting of the stack",
+    25: "grid side",
+}
+
+
+def day01(size: int, rng: random.Random) -> str:
+    depth = 100
+    depths = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+    return "\n".join(str(d) for d in depths) + "\n"
+
+
+def day02(size: int, rng: random.Random) -> str:
+    instructions = ["forward", "down", "up"]
+    return "".join(
+        f"{rng.choice(instructions)} {rng.randint(1, 9)}\n" for _ in range(size)
+    )
+
+
+def day03(size: int, rng: random.Random) -> str:
+    num_bits = max(12, size.bit_length() + 1)
+    while True:
+        numbers = rng.sample(range(2**num_bits), size)
+        if has_ratings(numbers, num_bits):
+            return "".join(f"{n:0{num_bits}b}\n" for n in numbers)
+
+
+def has_ratings(numbers: list[int], num_bits: int) -> bool:
+    """
+    Check that filtering by the least common bit never removes every
+    number, which is not allowed by the puzzle.
+    """
+    for bit in reversed(range(num_bits)):
+        if len(numbers) == 1:
+            return True
+        ones = [n for n in numbers if n >> bit & 1]
+        zeros = [n for n in numbers if not n >> bit & 1]
+        numbers = zeros if len(ones) >= len(zeros) else ones
+        if not numbers:
+            return False
+    return len(numbers) == 1
+
+
+def day04(size: int, rng: random.Random) -> str:
+    highest = 99
+    # Draw every number so that every card is eventually completed
+    draws = list(range(highest + 1))
+    rng.shuffle(draws)
+
+    cards = []
+    for _ in range(size):
+        numbers = rng.sample(range(highest + 1), 25)
+        rows = [numbers[x : x + 5] for x in range(0, 25, 5)]
+        cards.append("\n".join(" ".join(f"{n:>2}" for n in row) for row in rows))
+
+    return ",".join(str(n) for n in draws) + "\n\n" + "\n\n".join(cards) + "\n"
+
+
+def day05(size: int, rng: random.Random) -> str:
+    extent = 1000
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        orientation = rng.choice(["horizontal", "vertical", "diagonal"])
+        if orientation == "horizontal":
+            x2, y2 = rng.randrange(extent), y1
+        elif orientation == "vertical":
+            x2, y2 = x1, rng.randrange(extent)
+        else:
+            length = rng.randint(-min(x1, y1), extent - 1 - max(x1, y1))
+            x2 = x1 + length
+            y2 = y1 + length * rng.choice([1, -1])
+            if not 0 <= y2 < extent:
+                y2 = y1 - (y2 - y1)
+                if not 0 <= y2 < extent:
+                    x2, y2 = x1, y1
+        lines.append(f"{x1},{y1} -> {x2},{y2}\n")
+    return "".join(lines)
+
+
+def day06(size: int, rng: random.Random) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n"
+
+
+def day07(size: int, rng: random.Random) -> str:
+    return ",".join(str(rng.randint(0, size)) for _ in range(size)) + "\n"
+
+
+digit_segments = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def day08(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        wires = list("abcdefg")
+        rng.shuffle(wires)
+        wiring = dict(zip("abcdefg", wires))
+
+        def scramble(digit: int) -> str:
+            segments = [wiring[s] for s in digit_segments[digit]]
+            rng.shuffle(segments)
+            return "".join(segments)
+
+        signal = [scramble(d) for d in rng.sample(range(10), 10)]
+        output = [scramble(rng.randrange(10)) for _ in range(4)]
+        lines.append(f"{' '.join(signal)} | {' '.join(output)}\n")
+    return "".join(lines)
+
+
+def grid_of_digits(size: int, rng: random.Random, digits: str) -> str:
+    return "".join(
+        "".join(rng.choice(digits) for _ in range(size)) + "\n" for _ in range(size)
+    )
+
+
+def day09(size: int, rng: random.Random) -> str:
+    # Extra nines so that the grid splits into lots of basins
+    return grid_of_digits(size, rng, "01234567899999")
+
+
+brackets = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def day10(size: int, rng: random.Random) -> str:
+    lines = []
+    for i in range(size):
+        stack: list[str] = []
+        line = ""
+        for _ in range(rng.randint(20, 100)):
+            if stack and rng.random() < 0.45:
+                line += brackets[stack.pop()]
+            else:
+                opening = rng.choice(list(brackets))
+                stack.append(opening)
+                line += opening
+
+        if not stack:
+            stack.append("(")
+            line += "("
+
+        if i % 2:
+            # Corrupt the line with a closing character that doesn't match
+            wrong = [c for c in brackets.values() if c != brackets[stack[-1]]]
+            line += rng.choice(wrong)
+        lines.append(line + "\n")
+    return "".join(lines)
+
+
+def day11(size: int, rng: random.Random) -> str:
+    # Uniformly random grids often never synchronise, so start from a
+    # synchronised grid and disturb a few of the octopuses
+    energy = rng.choice(string.digits)
+    return "".join(
+        "".join(
+            rng.choice(string.digits) if rng.random() < 0.1 else energy
+            for _ in range(size)
+        )
+        + "\n"
+        for _ in range(size)
+    )
+
+
+def day12(size: int, rng: random.Random) -> str:
+    small_caves = rng.sample(
+        ["".join(p) for p in itertools.permutations(string.ascii_lowercase, 2)],
+        size,
+    )
+    # Big caves are never connected to each other, otherwise there are
+    # infinitely many routes
+    big_caves = ["A", "B", "C"][: max(1, size // 3)]
+
+    edges = set()
+    for cave in small_caves:
+        edges.add((cave, rng.choice(big_caves)))
+        if rng.random() < 0.5:
+            edges.add((cave, rng.choice(small_caves)))
+    for big_cave in big_caves:
+        edges.add(("start", big_cave))
+        edges.add((big_cave, "end"))
+    edges.add(("start", rng.choice(small_caves)))
+    edges.add((rng.choice(small_caves), "end"))
+
+    return "".join(f"{a}-{b}\n" for a, b in sorted(edges) if a != b)
+
+
+def day13(size: int, rng: random.Random) -> str:
+    # Work backwards from the final size, doubling the paper for each fold
+    width, height = 39, 5
+    folds = []
+    for axis in "yxyxyx":
+        if axis == "x":
+            folds.append(f"fold along x={width + 1}")
+            width = 2 * width + 2
+        else:
+            folds.append(f"fold along y={height + 1}")
+            height = 2 * height + 2
+    folds.reverse()
+    fold_xs = {int(f.split("=")[1]) for f in folds if "x=" in f}
+    fold_ys = {int(f.split("=")[1]) for f in folds if "y=" in f}
+
+    dots: set[Tuple[int, int]] = set()
+    while len(dots) < size:
+        x, y = rng.randint(0, width), rng.randint(0, height)
+        if x not in fold_xs and y not in fold_ys:
+            dots.add((x, y))
+
+    dots_str = "\n".join(f"{x},{y}" for x, y in sorted(dots))
+    return dots_str + "\n\n" + "\n".join(folds) + "\n"
+
+
+def day14(size: int, rng: random.Random) -> str:
+    elements = "BCFHKNOPSV"
+    template = "".join(rng.choice(elements) for _ in range(size))
+    rules = [f"{x}{y} -> {rng.choice(elements)}" for x in elements for y in elements]
+    rng.shuffle(rules)
+    return template + "\n\n" + "\n".join(rules) + "\n"
+
+
+def day15(size: int, rng: random.Random) -> str:
+    return grid_of_digits(size, rng, "123456789")
+
+
+def day16(size: int, rng: random.Random) -> str:
+    def bits(n: int, width: int) -> str:
+        return f"{n:0{width}b}"
+
+    def literal(version: int) -> str:
+        value = rng.randint(0, 2**16)
+        groups = [bits(value, 20)[x : x + 4] for x in range(0, 20, 4)]
+        while len(groups) > 1 and groups[0] == "0000":
+            groups.pop(0)
+        encoded = "".join(
+            ("0" if i == len(groups) - 1 else "1") + group
+            for i, group in enumerate(groups)
+        )
+        return bits(version, 3) + bits(4, 3) + encoded
+
+    def packet(budget: int, depth: int) -> str:
+        version = rng.randint(0, 7)
+        if budget <= 1 or depth > 20:
+            return literal(version)
+
+        if budget < 8 and rng.random() < 0.5:
+            # Comparisons have exactly two sub-packets
+            packet_type = rng.choice([5, 6, 7])
+            num_subpackets = 2
+        else:
+            # Keep products small by only using them for a few sub-packets
+            packet_type = rng.choice([0, 2, 3]) if budget > 4 else 1
+            num_subpackets = rng.randint(1, min(budget - 1, 20))
+
+        sizes = [1] * num_subpackets
+        for _ in range(budget - 1 - num_subpackets):
+            sizes[rng.randrange(num_subpackets)] += 1
+        sub_packets = "".join(packet(s, depth + 1) for s in sizes)
+
+        if len(sub_packets) < 2**15 and rng.random() < 0.5:
+            header = "0" + bits(len(sub_packets), 15)
+        else:
+            header = "1" + bits(num_subpackets, 11)
+        return bits(version, 3) + bits(packet_type, 3) + header + sub_packets
+
+    bit_string = packet(size, 0)
+    bit_string += "0" * (-len(bit_string) % 4)
+    return (
+        "".join(
+            f"{int(bit_string[x:x + 4], 2):X}" for x in range(0, len(bit_string), 4)
+        )
+        + "\n"
+    )
+
+
+def day17(size: int, rng: random.Random) -> str:
+    # day 17 assumes there's a triangular number in the x range, which
+    # holds as long as the target isn't tiny
+    size = max(size, 10)
+    x_min = rng.randint(2 * size, 3 * size)
+    x_max = x_min + size
+    y_min = -rng.randint(size, 2 * size)
+    y_max = y_min + rng.randint(1, size // 2)
+    return f"target area: x={x_min}..{x_max}, y={y_min}..{y_max}\n"
+
+
+def day18(size: int, rng: random.Random) -> str:
+    def snailfish_number(depth: int) -> str:
+        if depth == 4 or (depth > 1 and rng.random() < 0.3):
+            return str(rng.randint(0, 9))
+        return f"[{snailfish_number(depth + 1)},{snailfish_number(depth + 1)}]"
+
+    return "".join(
+        f"[{snailfish_number(1)},{snailfish_number(1)}]\n" for _ in range(size)
+    )
+
+
+def rotations() -> list[Callable]:
+    """The 24 rotations of 3d space, as permutations of axes with signs."""
+    out = []
+    for perm in itertools.permutations(range(3)):
+        parity = (
+            sum(1 for i in range(3) for j in range(i + 1, 3) if perm[i] > perm[j]) % 2
+        )
+        for signs in itertools.product([1, -1], repeat=3):
+            if (signs[0] * signs[1] * signs[2] == 1) == (parity == 0):
+                out.append(
+                    lambda p, perm=perm, signs=signs: tuple(
+                        signs[i] * p[perm[i]] for i in range(3)
+                    )
+                )
+    return out
+
+
+def day19(size: int, rng: random.Random) -> str:
+    scanner_range = 1000
+
+    def random_point(centre, spread):
+        return tuple(c + rng.randint(-spread, spread) for c in centre)
+
+    def in_range(scanner, beacon):
+        return all(abs(b - s) <= scanner_range for s, b in zip(scanner, beacon))
+
+    # Each scanner shares at least twelve beacons with the one before it
+    scanners = [(0, 0, 0)]
+    beacons: set = {random_point((0, 0, 0), scanner_range) for _ in range(20)}
+    for _ in range(size - 1):
+        previous = scanners[-1]
+        scanner = random_point(previous, 600)
+        overlap_centre = tuple((a + b) // 2 for a, b in zip(previous, scanner))
+        shared: set = set()
+        while len(shared) < 12:
+            beacon = random_point(overlap_centre, 200)
+            if in_range(previous, beacon) and in_range(scanner, beacon):
+                shared.add(beacon)
+        beacons |= shared
+        beacons |= {random_point(scanner, scanner_range) for _ in range(12)}
+        scanners.append(scanner)
+
+    all_rotations = rotations()
+    reports = []
+    for i, scanner in enumerate(scanners):
+        rotate = all_rotations[0] if i == 0 else rng.choice(all_rotations)
+        relative = [
+            rotate(tuple(b - s for b, s in zip(beacon, scanner)))
+            for beacon in beacons
+            if in_range(scanner, beacon)
+        ]
+        rng.shuffle(relative)
+        reports.append(
+            f"--- scanner {i} ---\n"
+            + "\n".join(",".join(str(c) for c in beacon) for beacon in relative)
+        )
+    return "\n\n".join(reports) + "\n"
+
+
+def day20(size: int, rng: random.Random) -> str:
+    # As in the real puzzle, an empty area lights up after one step and
+    # goes dark again after the next
+    algorithm = ["#"] + [rng.choice("#.") for _ in range(510)] + ["."]
+    image = "\n".join(
+        "".join(rng.choice("#.") for _ in range(size)) for _ in range(size)
+    )
+    return "".join(algorithm) + "\n\n" + image + "\n"
+
+
+def day21(size: int, rng: random.Random) -> str:
+    return (
+        f"Player 1 starting position: {rng.randint(1, 10)}\n"
+        f"Player 2 starting position: {rng.randint(1, 10)}\n"
+    )
+
+
+def day22(size: int, rng: random.Random) -> str:
+    def random_range(low: int, high: int, max_width: int) -> Tuple[int, int]:
+        start = rng.randint(low, high - max_width)
+        return start, start + rng.randint(0, max_width)
+
+    def cuboid(ranges: list[Tuple[int, int]]) -> str:
+        state = "on" if rng.random() < 0.6 else "off"
+        bounds = ",".join(
+            f"{axis}={start}..{end}" for axis, (start, end) in zip("xyz", ranges)
+        )
+        return f"{state} {bounds}\n"
+
+    # A few cuboids in the initialisation region, as in the real puzzle
+    num_initialisation = min(20, size // 5 + 1)
+    lines = [
+        cuboid([random_range(-50, 50, 30) for _ in range(3)])
+        for _ in range(num_initialisation)
+    ]
+    for _ in range(size - num_initialisation):
+        # Keep the larger cuboids clear of the initialisation region
+        x_start, x_end = random_range(100, 100000, 60000)
+        if rng.random() < 0.5:
+            x_start, x_end = -x_end, -x_start
+        y_range = random_range(-100000, 100000, 60000)
+        z_range = random_range(-100000, 100000, 60000)
+        lines.append(cuboid([(x_start, x_end), y_range, z_range]))
+    return "".join(lines)
+
+
+def day23(size: int, rng: random.Random) -> str:
+    amphipods = list("AABBCCDD")
+    rng.shuffle(amphipods)
+    top, bottom = amphipods[:4], amphipods[4:]
+    return (
+        "#############\n"
+        "#...........#\n"
+        f"###{'#'.join(top)}###\n"
+        f"  #{'#'.join(bottom)}#\n"
+        "  #########\n"
+    )
+
+
+monad_block = """inp w
+mul x 0
+add x z
+mod x 26
+div z {div}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y
+"""
+
+
+def day24(size: int, rng: random.Random) -> str:
+    # Each push block must be matched by a pop block, like brackets. The
+    # number of states kept by the solver grows with the depth of the
+    # stack, so size caps it.
+    max_depth = max(1, min(size, 7))
+    pushes_left, depth = 7, 0
+    order: list[str] = []
+    while len(order) < 14:
+        can_push = pushes_left and depth < max_depth
+        if can_push and (depth == 0 or rng.random() < 0.5):
+            order.append("push")
+            pushes_left -= 1
+            depth += 1
+        else:
+            order.append("pop")
+            depth -= 1
+
+    blocks = []
+    stack = []
+    for kind in order:
+        if kind == "push":
+            offset = rng.randint(1, 15)
+            stack.append(offset)
+            blocks.append(
+                monad_block.format(div=1, check=rng.randint(10, 15), offset=offset)
+            )
+        else:
+            pushed_offset = stack.pop()
+            difference = rng.randint(-8, 8)
+            blocks.append(
+                monad_block.format(
+                    div=26, check=difference - pushed_offset, offset=rng.randint(1, 15)
+                )
+            )
+    return "".join(blocks)
+
+
+def day25(size: int, rng: random.Random) -> str:
+    grid = [[rng.choice(">>v...") for _ in range(size)] for _ in range(size)]
+
+    # A full row of east-facing and a full column of south-facing sea
+    # cucumbers can never move. Every other sea cucumber eventually piles
+    # up against them, so the herds are guaranteed to stop. Without these
+    # a row with a gap in it can keep moving forever.
+    wall_row, wall_column = rng.randrange(size), rng.randrange(size)
+    for i in range(size):
+        grid[i][wall_column] = "v"
+    grid[wall_row] = [">"] * size
+
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+GENERATORS: dict[int, Generator] = {
+    int(name[3:]): func
+    for name, func in list(globals().items())
+    if name.startswith("day") and callable(func)
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](size, random.Random(f"{day}-{size}-{seed}"))
+
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input")
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parsed = parser.parse_args(args)
+    print(generate(parsed.day, parsed.size, parsed.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
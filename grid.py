@@ -0,0 +1,128 @@
+"""
+A compact two dimensional grid of small integers.
+
+The cells are stored row by row in a flat array, and are referred to by
+their index into it rather than by (x, y) tuples. A neighbour's index is
+the cell's index plus an offset, such as -1 for the cell to the left or
++width for the one below, so the inner loops of the solutions don't
+allocate or hash tuples for every cell.
+
+Rather than checking bounds, the solutions give their grids a border
+(see Grid.padded) so that every cell of the original grid has all of
+its neighbours, and fill it with a value that stops them going further.
+"""
+from array import array
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+Point = Tuple[int, int]
+
+# Directions of neighbours, in the order of their offsets. Orthogonal
+# neighbours come first, so with diagonals=True the first four offsets
+# are the same as without.
+UP, RIGHT, DOWN, LEFT = range(4)
+ORTHOGONAL = ((0, -1), (1, 0), (0, 1), (-1, 0))
+DIAGONAL = ((1, -1), (1, 1), (-1, 1), (-1, -1))
+
+
+def offsets(width: int, diagonals: bool = False) -> Tuple[int, ...]:
+    """The offsets of the neighbours of a cell, in a grid width wide."""
+    directions = ORTHOGONAL + DIAGONAL if diagonals else ORTHOGONAL
+    return tuple(dy * width + dx for dx, dy in directions)
+
+
+class Grid:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: Optional[array] = None,
+        typecode: str = "b",
+    ):
+        self.width = width
+        self.height = height
+        if cells is None:
+            cells = array(typecode, [0]) * (width * height)
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+        self.cells = cells
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        value: Callable[[str], int] = int,
+        typecode: str = "b",
+    ) -> "Grid":
+        rows = [line.strip() for line in lines]
+        rows = [row for row in rows if row]
+        cells = array(typecode, (value(c) for row in rows for c in row))
+        return cls(len(rows[0]), len(rows), cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Grid)
+            and self.width == other.width
+            and self.height == other.height
+            and self.cells == other.cells
+        )
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def point(self, index: int) -> Point:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def neighbour_offsets(self, diagonals: bool = False) -> Tuple[int, ...]:
+        """
+        The offsets of neighbours in this grid. Fetch them once outside of
+        a hot loop, then add them to an index.
+        """
+        return offsets(self.width, diagonals)
+
+    def interior(self, border: int = 1) -> list[int]:
+        """The indices of the cells that aren't in a border of this width."""
+        return [
+            y * self.width + x
+            for y in range(border, self.height - border)
+            for x in range(border, self.width - border)
+        ]
+
+    def copy(self, cells: Optional[array] = None) -> "Grid":
+        """A grid of the same shape, with a copy of these or the given cells."""
+        if cells is None:
+            cells = self.cells[:]
+        return Grid(self.width, self.height, cells)
+
+    def padded(self, border: int, fill: int) -> "Grid":
+        """A larger grid with a border of fill values all the way around."""
+        width = self.width + 2 * border
+        cells = array(self.cells.typecode, [fill]) * (width * border)
+        side = array(self.cells.typecode, [fill]) * border
+        for row in self.rows():
+            cells.extend(side)
+            cells.extend(row)
+            cells.extend(side)
+        cells.extend(array(self.cells.typecode, [fill]) * (width * border))
+        return Grid(width, self.height + 2 * border, cells)
+
+    def rows(self) -> Iterator[array]:
+        for y in range(self.height):
+            yield self.cells[y * self.width : (y + 1) * self.width]
+
+    def as_string(self, symbols: Optional[str] = None, separator: str = "") -> str:
+        def symbol(value: int) -> str:
+            return symbols[value] if symbols is not None else str(value)
+
+        return "\n".join(
+            separator.join(symbol(value) for value in row) for row in self.rows()
+        )
@@ -0,0 +1,131 @@
+"""
+Loading puzzle inputs.
+
+An input can be a path, "-" for stdin, or a file that has already been
+memory-mapped. It can be read all at once as a string, iterated over
+lazily a line at a time, or viewed as bytes without copying it.
+
+    text = loader.read_text("day01.txt")
+
+    for line in loader.iter_lines("-"):
+        ...
+
+    with loader.open_bytes("day16.txt") as data:
+        ...
+
+Large files can be split into chunks of whole lines, to be worked on
+in parallel:
+
+    for start, end in loader.chunk_ranges("day01.txt", min_chunks=8):
+        ...
+"""
+from contextlib import contextmanager
+import mmap
+import os
+import sys
+from typing import Iterator, Tuple, Union
+
+STDIN = "-"
+
+Source = Union[str, mmap.mmap]
+
+# Files at least this large are worth splitting between processes. Below
+# this, starting the processes takes longer than it saves.
+PARALLEL_THRESHOLD = 32 * 1024 * 1024
+
+# Each process works on a chunk at a time, so this bounds their memory
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def read_text(source: Source) -> str:
+    if isinstance(source, mmap.mmap):
+        return source[:].decode()
+    if source == STDIN:
+        return sys.stdin.read()
+    with open(source) as f:
+        return f.read()
+
+
+def iter_lines(source: Source) -> Iterator[str]:
+    """
+    Yield the lines of the input one at a time, without their line
+    endings. Only the current line is held in memory.
+    """
+    if isinstance(source, mmap.mmap):
+        start = 0
+        while start < len(source):
+            end = source.find(b"\n", start)
+            if end < 0:
+                end = len(source)
+            yield source[start:end].decode().rstrip("\r")
+            start = end + 1
+    elif source == STDIN:
+        for line in sys.stdin:
+            yield line.rstrip("\r\n")
+    else:
+        with open(source) as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+
+
+@contextmanager
+def open_bytes(source: Source) -> Iterator[memoryview]:
+    """
+    A read only view of the bytes of the input. Files are memory-mapped
+    rather than read, so nothing is copied until it is used. Stdin can't be
+    mapped, so it is read into memory.
+    Don't keep slices of the view after the block has ended.
+    """
+    if isinstance(source, mmap.mmap):
+        with memoryview(source) as view:
+            yield view
+    elif source == STDIN:
+        with memoryview(sys.stdin.buffer.read()) as view:
+            yield view
+    else:
+        with open(source, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                with memoryview(b"") as view:
+                    yield view
+                return
+            with mapped, memoryview(mapped) as view:
+                yield view
+
+
+@contextmanager
+def map_file(filename: str) -> Iterator[mmap.mmap]:
+    """Memory-map a file, which mustn't be empty, for reading."""
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def chunk_ranges(
+    filename: str, min_chunks: int = 1, chunk_size: int = CHUNK_SIZE
+) -> list[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of about the same size, at least
+    min_chunks of them if there are enough lines, and not much more than
+    chunk_size bytes each. Each one ends just after a line ending, or at
+    the end of the file, so no line is split between two chunks.
+    """
+    size = os.path.getsize(filename)
+    if size == 0:
+        return []
+
+    num_chunks = max(min_chunks, -(-size // chunk_size))
+    ranges = []
+    with map_file(filename) as data:
+        start = 0
+        for i in range(1, num_chunks + 1):
+            target = size * i // num_chunks
+            if target <= start:
+                continue
+            end = data.find(b"\n", target - 1)
+            end = size if end < 0 else end + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
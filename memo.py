@@ -0,0 +1,160 @@
+"""
+Bounded memoization with statistics.
+
+memoize is functools.lru_cache with a default bound, so a deep search
+can't use up all of the memory, and with every memoized function
+registered by name so that its hits, misses and size can be reported:
+
+    @memo.memoize(maxsize=100_000)
+    def search(state): ...
+
+    with memo.scoped(search):
+        search(start)        # the cache is cleared again at the end
+
+    memo.stats()             # {"search": MemoStats(hits=..., ...)}
+    memo.counts()            # {"memo_search_hits": ..., ...}
+
+Statistics are kept per call site, so memoized closures, which are
+created afresh on every call of the function that defines them, all add
+up under the same name. Statistics for entries that have been cleared
+are kept too. A function's evictions are the results it dropped to stay
+within its bound.
+
+runner.py --counters reports counts() for each part along with the
+solvers' own counters (see counters.py).
+
+The default bound can be changed with the AOC_MEMO_MAXSIZE environment
+variable, which is read when a function is memoized.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+import functools
+import os
+from typing import Any, Callable, Iterator, Optional, TypeVar
+import weakref
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+MAXSIZE_ENV_VAR = "AOC_MEMO_MAXSIZE"
+DEFAULT_MAXSIZE = 2**17
+
+# Stands for the default, which can't be None as that means unbounded
+_DEFAULT = -1
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    evictions: int = 0
+    maxsize: Optional[int] = None
+
+    def add(self, other: "MemoStats") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.size += other.size
+        self.evictions += other.evictions
+        self.maxsize = other.maxsize
+
+
+# Memoized functions that are still alive, and the statistics of entries
+# that have already been cleared, by name
+_live: dict[str, weakref.WeakSet] = {}
+_cleared: dict[str, MemoStats] = {}
+
+
+def default_maxsize() -> Optional[int]:
+    value = os.environ.get(MAXSIZE_ENV_VAR)
+    if value is None:
+        return DEFAULT_MAXSIZE
+    return int(value) or None
+
+
+def memoize(
+    maxsize: Optional[int] = _DEFAULT, name: Optional[str] = None
+) -> Callable[[F], F]:
+    """
+    Memoize a function, keeping at most maxsize results and evicting the
+    least recently used first. maxsize=None means no bound at all. By
+    default the statistics are kept under the function's qualified name.
+    """
+
+    def decorator(func: F) -> F:
+        size = default_maxsize() if maxsize == _DEFAULT else maxsize
+        cached = functools.lru_cache(maxsize=size)(func)
+        cached.memo_name = name or func.__qualname__  # type: ignore
+        _live.setdefault(cached.memo_name, weakref.WeakSet()).add(cached)  # type: ignore
+        return cached  # type: ignore
+
+    return decorator
+
+
+def _info(func: Callable) -> MemoStats:
+    info = func.cache_info()  # type: ignore
+    # Every miss adds a result, which only goes again when it's evicted or
+    # the cache is cleared
+    evictions = info.misses - info.currsize
+    return MemoStats(info.hits, info.misses, info.currsize, evictions, info.maxsize)
+
+
+def clear(func: Callable) -> None:
+    """Empty a memoized function's cache, keeping its statistics."""
+    cleared = _cleared.setdefault(func.memo_name, MemoStats())  # type: ignore
+    stats = _info(func)
+    stats.size = 0
+    cleared.add(stats)
+    func.cache_clear()  # type: ignore
+
+
+@contextmanager
+def scoped(*funcs: Callable) -> Iterator[None]:
+    """Clear the caches of funcs when the block ends."""
+    try:
+        yield
+    finally:
+        for func in funcs:
+            clear(func)
+
+
+def stats() -> dict[str, MemoStats]:
+    """Statistics for every memoized function, by name."""
+    totals = {}
+    for name in sorted(set(_live) | set(_cleared)):
+        total = MemoStats()
+        if name in _cleared:
+            total.add(_cleared[name])
+        for func in list(_live.get(name, ())):
+            total.add(_info(func))
+        totals[name] = total
+    return totals
+
+
+def counts() -> dict[str, int]:
+    """
+    stats() as flat counters, e.g. memo_search_hits, in the same form as
+    counters.get(). Functions that haven't been called are left out.
+    """
+    flat = {}
+    for name, total in stats().items():
+        if not (total.hits or total.misses):
+            continue
+        prefix = "memo_" + name.replace(".<locals>.", "_").replace(".", "_")
+        flat[f"{prefix}_hits"] = total.hits
+        flat[f"{prefix}_misses"] = total.misses
+        flat[f"{prefix}_size"] = total.size
+        flat[f"{prefix}_evictions"] = total.evictions
+        if total.maxsize is not None:
+            flat[f"{prefix}_maxsize"] = total.maxsize
+    return flat
+
+
+def reset_stats() -> None:
+    """
+    Forget all the statistics so far. lru_cache can only reset its
+    statistics along with its results, so live caches are emptied too.
+    """
+    _cleared.clear()
+    for funcs in _live.values():
+        for func in list(funcs):
+            func.cache_clear()
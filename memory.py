@@ -0,0 +1,146 @@
+"""
+Peak memory for each phase of each day.
+
+For every phase this records the peak traced allocation (from
+tracemalloc, over and above what was already allocated when the phase
+started), the peak resident set size of the process so far, and the
+source lines responsible for most of the memory near the peak.
+
+Enabled with runner.py --memory or the AOC_MEMORY environment
+variable. Tracing allocations slows the solutions down a lot, so don't
+combine it with timings you care about.
+"""
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+import json
+import os
+import resource
+import threading
+import tracemalloc
+from typing import Iterable, Iterator, Optional, Tuple
+
+from timings import PHASES
+
+ENV_VAR = "AOC_MEMORY"
+
+NUM_TOP_SITES = 5
+
+
+@dataclass
+class PhaseMemory:
+    day: int
+    phase: str
+    peak_traced: int = 0
+    peak_resident: int = 0
+    top_sites: list[str] = field(default_factory=list)
+
+
+class PeakSampler(threading.Thread):
+    """
+    Take a snapshot of allocations every time traced memory reaches a new
+    high, so that we can report what was allocated at the peak rather than
+    what is left over at the end of the phase.
+    """
+
+    def __init__(self, interval: float = 0.01, growth: float = 1.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * self.growth:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def stop(self) -> tracemalloc.Snapshot:
+        self.stopped.set()
+        self.join()
+        return self.snapshot or tracemalloc.take_snapshot()
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, limit: int = NUM_TOP_SITES) -> list[str]:
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    return [
+        f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno} "
+        f"{stat.size} bytes in {stat.count} blocks"
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def peak_resident() -> int:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Memory:
+    def __init__(self):
+        self.phases: dict[Tuple[int, str], PhaseMemory] = {}
+
+    def get(self, day: int, phase: str) -> PhaseMemory:
+        if (day, phase) not in self.phases:
+            self.phases[(day, phase)] = PhaseMemory(day, phase)
+        return self.phases[(day, phase)]
+
+    @contextmanager
+    def measure(self, day: int, phase: str) -> Iterator[None]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        sampler = PeakSampler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            snapshot = sampler.stop()
+            _, peak = tracemalloc.get_traced_memory()
+            self.update(
+                [
+                    PhaseMemory(
+                        day, phase, peak - start, peak_resident(), top_sites(snapshot)
+                    )
+                ]
+            )
+
+    def update(self, phases: Iterable[PhaseMemory]) -> None:
+        """Keep the largest measurement of each phase."""
+        for m in phases:
+            memory = self.get(m.day, m.phase)
+            memory.peak_resident = max(memory.peak_resident, m.peak_resident)
+            if m.peak_traced >= memory.peak_traced:
+                memory.peak_traced = m.peak_traced
+                memory.top_sites = m.top_sites
+
+    def to_json(self) -> dict:
+        days: dict[int, dict] = {}
+        for (day, phase), memory in sorted(
+            self.phases.items(), key=lambda item: (item[0][0], PHASES.index(item[0][1]))
+        ):
+            fields = asdict(memory)
+            del fields["day"], fields["phase"]
+            days.setdefault(day, {})[phase] = fields
+        return {"days": [{"day": day, "phases": days[day]} for day in sorted(days)]}
+
+
+def output_filename(option: Optional[str] = None) -> Optional[str]:
+    return option or os.environ.get(ENV_VAR) or None
+
+
+def write(memory: Memory, filename: str) -> None:
+    output = json.dumps(memory.to_json(), indent=2)
+    if filename == "-":
+        print(output)
+    else:
+        with open(filename, "w") as f:
+            f.write(output + "\n")
@@ -0,0 +1,43 @@
+"""
+Solving the two parts of a day at the same time, in separate processes.
+
+On some days the parts are independent computations on the same parsed
+input, and those days set INDEPENDENT_PARTS = True. Solving both parts
+at once then takes as long as the slower of the two rather than the sum
+of both. Other days are solved with their solve() as usual, which shares
+any work common to both parts.
+
+Enabled for ./dayNN.py with the AOC_PARALLEL_PARTS environment variable:
+
+    AOC_PARALLEL_PARTS=1 ./day15.py
+
+The runner always solves each part in a separate process anyway.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+from types import ModuleType
+from typing import Any, Optional, Tuple
+
+import engines
+
+ENV_VAR = "AOC_PARALLEL_PARTS"
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def solve(module: ModuleType, parsed: Any, parallel: Optional[bool] = None) -> Tuple:
+    """
+    Both answers for a day, solving the parts in parallel if the day
+    allows it and parallel (by default, the environment variable) says so.
+    """
+    if parallel is None:
+        parallel = enabled()
+    if not (parallel and getattr(module, "INDEPENDENT_PARTS", False)):
+        return module.solve(parsed)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        part_1 = executor.submit(engines.select(module, "part_1"), parsed)
+        part_2 = executor.submit(engines.select(module, "part_2"), parsed)
+        return part_1.result(), part_2.result()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+"""
+Run the solutions for any set of days across a pool of processes.
+
+Every part of every day is a separate job, so a full run takes roughly
+as long as the slowest part rather than the sum of all of them.
+
+    ./runner.py               # run every day
+    ./runner.py 19 22 23 24   # run selected days
+    ./runner.py --timings -   # also print per-phase timings as JSON
+    ./runner.py --memory -    # also print per-phase peak memory as JSON
+    ./runner.py --no-cache    # don't use cached answers
+    ./runner.py --counters    # also show the work done, e.g. states searched
+    ./runner.py --engine reference   # use the reference engines, see engines.py
+
+Answers are cached on disk, keyed on the input and the solver's source,
+see cache.py. The cache isn't used when timings, memory or counters are
+asked for, as a cached answer or parse would leave nothing to measure.
+"""
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+import importlib
+import os
+import sys
+import time
+from types import ModuleType
+from typing import Any, Iterable, Optional, Tuple
+
+import cache
+import counters
+import engines
+import memo
+import memory
+import timings
+
+NUM_DAYS = 25
+PARTS = (1, 2)
+
+# These days dominate a full run, so submit them first rather than
+# leaving them to the end of the queue
+SLOW_DAYS = (19, 22, 23, 24)
+
+
+@dataclass
+class Result:
+    day: int
+    part: int
+    answer: Any = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+    phases: list[timings.PhaseTiming] = field(default_factory=list)
+    peak_memory: list[memory.PhaseMemory] = field(default_factory=list)
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+def load_day(day: int) -> ModuleType:
+    return importlib.import_module(f"day{day:02}")
+
+
+def input_filename(day: int, input_dir: str = ".") -> str:
+    return os.path.join(input_dir, f"day{day:02}.txt")
+
+
+def run_part(
+    day: int,
+    part: int,
+    filename: str,
+    measure_memory: bool = False,
+    use_cache: bool = True,
+    input_str: Optional[str] = None,
+    count: bool = False,
+    engine: Optional[str] = None,
+) -> Result:
+    """
+    Read, parse and solve one part of one day. This is the function
+    that runs in the worker processes.
+    If input_str is given it is used instead of reading filename. If
+    count is set, the solver's counters and memoization statistics are
+    returned with the answer.
+    engine names the engines to use rather than the fastest ones.
+    The cache is never used when measuring memory or counting, as the
+    parse and parts would then not run at all.
+    """
+    use_cache = use_cache and not (measure_memory or count)
+    phase_timings = timings.Timings()
+    phase_memory = memory.Memory()
+
+    def measure(phase: str) -> ExitStack:
+        stack = ExitStack()
+        stack.enter_context(phase_timings.measure(day, phase))
+        if measure_memory:
+            stack.enter_context(phase_memory.measure(day, phase))
+        return stack
+
+    start = time.perf_counter()
+    module = load_day(day)
+    if input_str is None:
+        with measure("read"):
+            input_str = module.read_input(filename)
+
+    if use_cache:
+        key = cache.cache_key(day, part, input_str, module, engine)
+        if entry := cache.get(key):
+            return Result(
+                day, part, entry["answer"], time.perf_counter() - start, cached=True
+            )
+
+    with measure("parse"):
+        if use_cache:
+            parsed = cache.parse_input(day, input_str, module, engine)
+        else:
+            parsed = engines.select(module, "parse", engine)(input_str)
+    solve = engines.select(module, f"part_{part}", engine)
+    with measure(f"part_{part}"), ExitStack() as stack:
+        part_counters = stack.enter_context(counters.counting()) if count else {}
+        if count:
+            memo.reset_stats()
+        answer = solve(parsed)
+    if count:
+        part_counters.update(memo.counts())
+
+    if use_cache:
+        cache.put(key, answer)
+
+    return Result(
+        day,
+        part,
+        answer,
+        time.perf_counter() - start,
+        phases=list(phase_timings.phases.values()),
+        peak_memory=list(phase_memory.phases.values()),
+        counters=part_counters,
+    )
+
+
+def schedule(days: Iterable[int]) -> list[Tuple[int, int]]:
+    ordered = sorted(days, key=lambda day: day not in SLOW_DAYS)
+    return [(day, part) for day in ordered for part in PARTS]
+
+
+def run_days(
+    days: Iterable[int],
+    input_dir: str = ".",
+    max_workers: Optional[int] = None,
+    measure_memory: bool = False,
+    use_cache: bool = True,
+    count: bool = False,
+    engine: Optional[str] = None,
+) -> list[Result]:
+    results = []
+    options: dict[str, Any] = {}
+    if measure_memory:
+        # Peak resident memory can only be measured for the whole life of
+        # a process, so give each part a fresh one. This option needs
+        # Python 3.11, so it's only passed when it's needed.
+        options["max_tasks_per_child"] = 1
+    with ProcessPoolExecutor(max_workers=max_workers, **options) as executor:
+        futures: dict[Future, Tuple[int, int]] = {
+            executor.submit(
+                run_part,
+                day,
+                part,
+                input_filename(day, input_dir),
+                measure_memory,
+                use_cache,
+                None,
+                count,
+                engine,
+            ): (day, part)
+            for day, part in schedule(days)
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                day, part = futures[future]
+                results.append(Result(day, part, error=f"{type(e).__name__}: {e}"))
+
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def format_answer(result: Result) -> str:
+    if result.error is not None:
+        return result.error
+    if result.answer is None:
+        return "-"
+    return str(result.answer)
+
+
+def format_table(results: list[Result]) -> str:
+    lines = [f"{'day':>3} {'part':>4} {'seconds':>9}  answer"]
+    for result in results:
+        answer, *extra_lines = format_answer(result).split("\n")
+        seconds = "cached" if result.cached else f"{result.seconds:.3f}"
+        lines.append(f"{result.day:>3} {result.part:>4} {seconds:>9}  {answer}")
+        lines.extend(f"{'':20}{line}" for line in extra_lines)
+        lines.extend(
+            f"{'':20}{name}: {value}" for name, value in sorted(result.counters.items())
+        )
+    return "\n".join(lines)
+
+
+def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "days",
+        type=int,
+        nargs="*",
+        default=list(range(1, NUM_DAYS + 1)),
+        help="days to run (default: all)",
+    )
+    parser.add_argument(
+        "--input-dir", default=".", help="directory containing dayNN.txt files"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of cores)",
+    )
+    parser.add_argument(
+        "--timings",
+        metavar="FILE",
+        help="write per-phase timings as JSON to FILE, or - for stdout "
+        f"(default: ${timings.ENV_VAR})",
+    )
+    parser.add_argument(
+        "--memory",
+        metavar="FILE",
+        help="write per-phase peak memory as JSON to FILE, or - for stdout "
+        f"(default: ${memory.ENV_VAR}). Needs Python 3.11 or later.",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        default=counters.enabled,
+        help="show the work done by each part, such as states searched and "
+        "memoization hits "
+        f"(default: ${counters.ENV_VAR})",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=engines.KINDS,
+        default=engines.default_name(),
+        help="use this engine where a day has one rather than the fastest "
+        f"(default: ${engines.ENV_VAR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="ignore cached answers and don't store new ones",
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+
+    timings_filename = timings.output_filename(args.timings)
+    memory_filename = memory.output_filename(args.memory)
+    measuring = bool(timings_filename or memory_filename or args.counters)
+    if measuring and args.use_cache:
+        print("Not using the cache, so that every part is measured", file=sys.stderr)
+    use_cache = args.use_cache and not measuring
+
+    start = time.perf_counter()
+    results = run_days(
+        args.days,
+        args.input_dir,
+        args.workers,
+        measure_memory=bool(memory_filename),
+        use_cache=use_cache,
+        count=args.counters,
+        engine=args.engine,
+    )
+    elapsed = time.perf_counter() - start
+
+    print(format_table(results))
+    print(f"Total wall time: {elapsed:.3f}s")
+
+    if use_cache:
+        cache.evict()
+
+    if timings_filename:
+        phase_timings = timings.Timings()
+        for result in results:
+            phase_timings.update(result.phases)
+        timings.write(phase_timings, timings_filename)
+
+    if memory_filename:
+        phase_memory = memory.Memory()
+        for result in results:
+            phase_memory.update(result.peak_memory)
+        memory.write(phase_memory, memory_filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+import day01
+import loader
+
+WINDOW_LENGTHS = (1, 2, 3)
+
+
+def random_depths(num_depths: int, seed: int = 0) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(100, 200) for _ in range(num_depths)]
+
+
+def expected(depths: list[int]) -> list[int]:
+    return [day01.num_increasing_values(depths, n) for n in WINDOW_LENGTHS]
+
+
+@pytest.mark.parametrize("num_depths", [0, 1, 2, 3, 4, 10, 1000])
+def test_count_increases(num_depths):
+    depths = random_depths(num_depths)
+    assert day01.count_increases(iter(depths), WINDOW_LENGTHS) == expected(depths)
+
+
+def write_depths(path, depths: list[int], trailing_newline: bool) -> str:
+    text = "\n".join(map(str, depths)) + ("\n" if trailing_newline else "")
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 5, 16, 100])
+def test_count_chunks(tmp_path, chunk_size, trailing_newline):
+    depths = random_depths(200, seed=chunk_size)
+    filename = write_depths(tmp_path / "day01.txt", depths, trailing_newline)
+
+    totals = [0] * len(WINDOW_LENGTHS)
+    for start, end in loader.chunk_ranges(filename, 1, chunk_size):
+        counts = day01.count_chunk(filename, start, end, WINDOW_LENGTHS)
+        totals = [total + count for total, count in zip(totals, counts)]
+    assert totals == expected(depths)
+
+
+@pytest.mark.parametrize("num_depths", [0, 2, 200])
+def test_count_file_parallel(tmp_path, num_depths):
+    depths = random_depths(num_depths)
+    filename = write_depths(tmp_path / "day01.txt", depths, trailing_newline=True)
+    counts = day01.count_file_parallel(
+        filename, WINDOW_LENGTHS, max_workers=2, chunk_size=16
+    )
+    assert counts == expected(depths)
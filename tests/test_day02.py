@@ -0,0 +1,37 @@
+import functools
+
+import pytest
+
+import day02
+from generators import generate
+import loader
+
+
+def write_commands(path, size: int, trailing_newline: bool) -> tuple[str, list[str]]:
+    text = generate(2, size, seed=size).rstrip("\n")
+    path.write_text(text + ("\n" if text and trailing_newline else ""))
+    return str(path), text.splitlines()
+
+
+def expected(lines: list[str]) -> tuple[int, int]:
+    return day02.do_part_a(lines), day02.do_part_b(lines)
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 7, 32, 1000])
+def test_compose_chunks(tmp_path, chunk_size, trailing_newline):
+    filename, lines = write_commands(tmp_path / "day02.txt", 100, trailing_newline)
+
+    summaries = (
+        day02.summarise_chunk(filename, start, end)
+        for start, end in loader.chunk_ranges(filename, 1, chunk_size)
+    )
+    summary = functools.reduce(day02.compose, summaries, (0, 0, 0))
+    assert day02.answers(summary) == expected(lines)
+
+
+@pytest.mark.parametrize("size", [0, 1, 100])
+def test_solve_file_parallel(tmp_path, size):
+    filename, lines = write_commands(tmp_path / "day02.txt", size, True)
+    answers = day02.solve_file_parallel(filename, max_workers=2, chunk_size=32)
+    assert answers == expected(lines)
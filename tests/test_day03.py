@@ -0,0 +1,76 @@
+import pickle
+import random
+
+import pytest
+
+import day03
+
+# use_numpy only makes a difference if numpy is installed
+USE_NUMPY = [
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(day03.numpy is None, reason="needs numpy"),
+    ),
+    False,
+]
+
+
+def random_report(seed: int, num_numbers: int, num_bits: int) -> list[str]:
+    rng = random.Random(seed)
+    numbers = {rng.getrandbits(num_bits) for _ in range(num_numbers)}
+    return [f"{x:0{num_bits}b}" for x in numbers]
+
+
+@pytest.mark.parametrize("seed", range(50))
+@pytest.mark.parametrize("most_common", [True, False])
+def test_get_rating(seed, most_common):
+    num_bits = seed % 8 + 1
+    lines = random_report(seed, seed + 1, num_bits)
+    numbers = [int(line, 2) for line in lines]
+    sorted_numbers = sorted(numbers)
+    try:
+        expected = day03.get_gas_number(numbers, num_bits, o2=most_common)
+    except IndexError:
+        # Every number was filtered out
+        with pytest.raises(ValueError):
+            day03.get_rating(sorted_numbers, num_bits, most_common)
+    else:
+        assert day03.get_rating(sorted_numbers, num_bits, most_common) == expected
+
+
+def expected_columns(lines: list[str]) -> list[int]:
+    return [sum(line[i] == "1" for line in lines) for i in range(len(lines[0]))]
+
+
+@pytest.mark.parametrize("use_numpy", USE_NUMPY)
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n"])
+@pytest.mark.parametrize("final_line_ending", [True, False])
+@pytest.mark.parametrize("num_bits", [1, 5, 12, 70])
+def test_count_columns(use_numpy, line_ending, final_line_ending, num_bits):
+    lines = random_report(num_bits, 100, num_bits)
+    text = line_ending.join(lines) + (line_ending if final_line_ending else "")
+    counts = day03.count_columns(text.encode(), use_numpy)
+    assert counts == (expected_columns(lines), len(lines))
+
+
+@pytest.mark.parametrize("use_numpy", USE_NUMPY)
+@pytest.mark.parametrize(
+    "text", ["\n101\n", "101\n11\n", "101\n11", "11\n1\n\n", "101\n010\n\n"]
+)
+def test_count_columns_uneven_lines(use_numpy, text):
+    with pytest.raises(ValueError):
+        day03.count_columns(text.encode(), use_numpy)
+
+
+@pytest.mark.parametrize("text", ["\n101\n010\n", "101\n10\n"])
+def test_report_columns_uneven_lines(text):
+    report = day03.parse_input(text)
+    assert day03.solve_part_1_columns(report) == day03.solve_part_1(report)
+
+
+def test_report_not_pickled_with_text():
+    report = day03.parse_input("101\n010\n")
+    loaded = pickle.loads(pickle.dumps(report))
+    assert loaded.text is None
+    assert loaded.numbers == report.numbers
+    assert day03.solve_part_1_columns(loaded) == day03.solve_part_1(report)
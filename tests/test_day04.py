@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+import day04
+
+# use_numpy only makes a difference if numpy is installed
+USE_NUMPY = [
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(day04.numpy is None, reason="needs numpy"),
+    ),
+    False,
+]
+
+
+def random_game(seed: int, num_cards: int, num_draws: int) -> day04.Game:
+    rng = random.Random(seed)
+    # Few enough numbers that cards often share them, and so are
+    # completed on the same draw
+    cards = [day04.BingoCard(rng.sample(range(40), 25)) for _ in range(num_cards)]
+    numbers = [rng.randrange(45) for _ in range(num_draws)]
+    return cards, numbers
+
+
+def tied_game() -> day04.Game:
+    # Both cards are completed on the fifth draw, the first by its top row
+    # and the second by its first column
+    first = day04.BingoCard(list(range(1, 26)))
+    others = iter(range(26, 46))
+    second = day04.BingoCard(
+        [i // 5 + 1 if i % 5 == 0 else next(others) for i in range(25)]
+    )
+    return [first, second], [1, 2, 3, 4, 5, 6]
+
+
+TIED_SCORES = (sum(range(6, 26)) * 5, sum(range(26, 46)) * 5)
+
+
+def played_winners(game: day04.Game) -> list[tuple[int, int]]:
+    """The index and score of each card as it's completed, by playing."""
+    cards, numbers = game
+    cards = [day04.BingoCard(card.numbers) for card in cards]
+    completed = []
+    for n in numbers:
+        for card_index, card in enumerate(cards):
+            if card_index not in dict(completed):
+                card.mark_number(n)
+                if card.is_finished():
+                    completed.append((card_index, card.score(n)))
+    return completed
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_winners(seed):
+    game = random_game(seed, num_cards=seed % 10 + 1, num_draws=seed + 10)
+    assert list(day04.winners(*game)) == played_winners(game)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_indexed(seed):
+    game = random_game(seed, num_cards=seed % 10 + 1, num_draws=60)
+    completed = played_winners(game)
+    cards, numbers = game
+    if not completed:
+        with pytest.raises(AssertionError):
+            day04.do_part_a_indexed(cards, numbers)
+        return
+    assert day04.do_part_a_indexed(cards, numbers) == completed[0][1]
+    if len(completed) < len(cards):
+        # A card that's never completed means there is no last card
+        with pytest.raises(AssertionError):
+            day04.do_part_b_indexed(cards, numbers)
+    else:
+        assert day04.do_part_b_indexed(cards, numbers) == completed[-1][1]
+
+
+def test_winners_ties_broken_by_card_order():
+    cards, numbers = tied_game()
+    assert list(day04.winners(cards, numbers)) == list(enumerate(TIED_SCORES))
+    assert day04.do_part_a_indexed(cards, numbers) == TIED_SCORES[0]
+    assert day04.do_part_b_indexed(cards, numbers) == TIED_SCORES[1]
+
+
+def played_turns(game: day04.Game) -> list[int]:
+    cards, numbers = game
+    turns = [len(numbers)] * len(cards)
+    for card_index in range(len(cards)):
+        card = day04.BingoCard(cards[card_index].numbers)
+        for turn, n in enumerate(numbers):
+            card.mark_number(n)
+            if card.is_finished():
+                turns[card_index] = turn
+                break
+    return turns
+
+
+@pytest.mark.parametrize("use_numpy", USE_NUMPY)
+@pytest.mark.parametrize("seed", range(50))
+def test_completion_turns(seed, use_numpy):
+    game = random_game(seed, num_cards=seed % 10 + 1, num_draws=seed + 10)
+    assert day04.completion_turns(*game, use_numpy) == played_turns(game)
+
+
+@pytest.mark.parametrize("use_numpy", USE_NUMPY)
+@pytest.mark.parametrize("seed", range(50))
+def test_ranked(seed, use_numpy):
+    game = random_game(seed, num_cards=seed % 10 + 1, num_draws=60)
+    completed = played_winners(game)
+    cards, numbers = game
+    if not completed:
+        with pytest.raises(AssertionError):
+            day04.do_part_a_ranked(cards, numbers, use_numpy)
+        return
+    assert day04.do_part_a_ranked(cards, numbers, use_numpy) == completed[0][1]
+    if len(completed) < len(cards):
+        with pytest.raises(AssertionError):
+            day04.do_part_b_ranked(cards, numbers, use_numpy)
+    else:
+        assert day04.do_part_b_ranked(cards, numbers, use_numpy) == completed[-1][1]
+
+
+def test_ranked_ties_broken_by_card_order():
+    cards, numbers = tied_game()
+    assert day04.completion_turns(cards, numbers, use_numpy=False) == [4, 4]
+    assert day04.solve((cards, numbers)) == TIED_SCORES
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+import day05
+
+Line = tuple[day05.Point, day05.Point]
+
+
+def random_line(rng: random.Random, low: int = -5, high: int = 10) -> Line:
+    x1, y1 = rng.randint(low, high), rng.randint(low, high)
+    kind = rng.choice(["horizontal", "vertical", "diagonal", "point"])
+    if kind == "point":
+        return (x1, y1), (x1, y1)
+    length = rng.randint(-6, 6)
+    if kind == "horizontal":
+        return (x1, y1), (x1 + length, y1)
+    if kind == "vertical":
+        return (x1, y1), (x1, y1 + length)
+    return (x1, y1), (x1 + length, y1 + rng.choice([-1, 1]) * length)
+
+
+def random_lines(seed: int, num_lines: int) -> list[Line]:
+    rng = random.Random(seed)
+    lines = [random_line(rng) for _ in range(num_lines)]
+    # Lines along some of the others, so that there are collinear
+    # overlaps in every direction
+    for (x1, y1), (x2, y2) in rng.sample(lines, num_lines // 3):
+        dx, dy = (x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1)
+        start, end = rng.randint(-3, 6), rng.randint(-3, 6)
+        lines.append(
+            ((x1 + start * dx, y1 + start * dy), (x1 + end * dx, y1 + end * dy))
+        )
+    rng.shuffle(lines)
+    return lines
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_analytic_matches_grid(seed):
+    lines = random_lines(seed, num_lines=seed % 20)
+    assert day05.do_part_a_analytic(lines) == day05.do_part_a(lines)
+    assert day05.do_part_b_analytic(lines) == day05.do_part_b(lines)
+    assert day05.solve(lines) == (day05.do_part_a(lines), day05.do_part_b(lines))
+
+
+def test_collinear_diagonals():
+    lines = [((0, 0), (4, 4)), ((2, 2), (6, 6)), ((5, 5), (3, 3)), ((4, 0), (0, 4))]
+    assert day05.do_part_b_analytic(lines) == day05.do_part_b(lines) == 4
+
+
+def test_zero_length_lines():
+    lines = [((1, 1), (1, 1)), ((1, 1), (1, 1)), ((0, 1), (2, 1)), ((2, 2), (2, 2))]
+    assert day05.do_part_a_analytic(lines) == day05.do_part_a(lines) == 1
+
+
+@pytest.mark.parametrize(
+    "direction_1, key_1, direction_2, key_2, expected",
+    [
+        (day05.HORIZONTAL, 3, day05.VERTICAL, -2, (-2, 3)),
+        (day05.UP, 1, day05.DOWN, 5, (2, 3)),
+        # y - x = 0 and x + y = 1 only meet halfway between points
+        (day05.UP, 0, day05.DOWN, 1, None),
+        (day05.UP, -3, day05.HORIZONTAL, 0, (3, 0)),
+        (day05.DOWN, -4, day05.VERTICAL, -1, (-1, -3)),
+    ],
+)
+def test_crossing(direction_1, key_1, direction_2, key_2, expected):
+    assert day05.crossing(direction_1, key_1, direction_2, key_2) == expected
+    assert day05.crossing(direction_2, key_2, direction_1, key_1) == expected
@@ -0,0 +1,83 @@
+"""
+Wall time, CPU time and call counts for each phase of each day.
+
+The phases are reading the input, parsing it, and solving each part.
+Timings are collected by runner.py and written out as JSON when it is
+given --timings, or when the AOC_TIMINGS environment variable is set to
+an output filename ("-" for stdout).
+"""
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+import json
+import os
+import time
+from typing import Iterable, Iterator, Optional, Tuple
+
+ENV_VAR = "AOC_TIMINGS"
+
+PHASES = ("read", "parse", "part_1", "part_2")
+
+
+@dataclass
+class PhaseTiming:
+    day: int
+    phase: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+
+
+class Timings:
+    def __init__(self):
+        self.phases: dict[Tuple[int, str], PhaseTiming] = {}
+
+    def get(self, day: int, phase: str) -> PhaseTiming:
+        if (day, phase) not in self.phases:
+            self.phases[(day, phase)] = PhaseTiming(day, phase)
+        return self.phases[(day, phase)]
+
+    @contextmanager
+    def measure(self, day: int, phase: str) -> Iterator[None]:
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.get(day, phase)
+            timing.wall += time.perf_counter() - start_wall
+            timing.cpu += time.process_time() - start_cpu
+            timing.calls += 1
+
+    def update(self, timings: Iterable[PhaseTiming]) -> None:
+        for t in timings:
+            timing = self.get(t.day, t.phase)
+            timing.wall += t.wall
+            timing.cpu += t.cpu
+            timing.calls += t.calls
+
+    def to_json(self) -> dict:
+        days: dict[int, dict] = {}
+        for (day, phase), timing in sorted(
+            self.phases.items(), key=lambda item: (item[0][0], PHASES.index(item[0][1]))
+        ):
+            fields = asdict(timing)
+            del fields["day"], fields["phase"]
+            days.setdefault(day, {})[phase] = fields
+        return {"days": [{"day": day, "phases": days[day]} for day in sorted(days)]}
+
+
+def output_filename(option: Optional[str] = None) -> Optional[str]:
+    """
+    Where to write timings, from the command line option if given and
+    otherwise from the environment. None means timings are disabled.
+    """
+    return option or os.environ.get(ENV_VAR) or None
+
+
+def write(timings: Timings, filename: str) -> None:
+    output = json.dumps(timings.to_json(), indent=2)
+    if filename == "-":
+        print(output)
+    else:
+        with open(filename, "w") as f:
+            f.write(output + "\n")